@@ -12,14 +12,10 @@ According to the doctoral thesis by Antonello, J. (2014): https://doi.org/10.423
 # %% Imports - global dependencies (from standard library and installed by conda / pip)
 import numpy as np
 import matplotlib.pyplot as plt
-from skimage import io
 import os
-from skimage.util import img_as_ubyte
-from skimage.feature import peak_local_max
 import time
 from matplotlib.patches import Rectangle, Circle
-from scipy import ndimage
-from numpy.linalg import lstsq
+from numpy.linalg import lstsq, pinv
 from pathlib import Path
 plt.close('all')
 
@@ -90,6 +86,8 @@ def get_localCoM_matrix(image: np.ndarray, min_dist_peaks: int = 15, threshold_a
         Calculated center of masses coordinates.
 
     """
+    from skimage.feature import peak_local_max
+    from scipy import ndimage
     detected_centers = peak_local_max(image, min_distance=min_dist_peaks, threshold_abs=threshold_abs)
     (rows, cols) = image.shape
     if plot:
@@ -458,7 +456,48 @@ def calc_integral_matrix_zernike(zernike_polynomials_list: list, integration_lim
     return integral_matrix
 
 
-def get_polynomials_coefficients(integral_matrix: np.ndarray, coms_shifts: np.ndarray) -> np.ndarray:
+def swap_integral_matrix(integral_matrix: np.ndarray) -> np.ndarray:
+    """
+    Rearrange the integral matrix so X and Y integrals of each sub-aperture are placed in the sequential rows.
+
+    This made according to suggestion in the paper Dai G.-M., 1994.
+
+    Parameters
+    ----------
+    integral_matrix : np.ndarray
+        Integrals of Zernike polynomials on sub-apertures, columns - X and Y integrals of each polynomial.
+
+    Returns
+    -------
+    np.ndarray
+        Integral matrix with (2*number of sub-apertures) rows and (number of polynomials) columns.
+
+    """
+    n_subapertures = np.size(integral_matrix, 0); n_polynomials = np.size(integral_matrix, 1) // 2
+    integral_matrix_swapped = integral_matrix[:, :2*n_polynomials].reshape(n_subapertures, n_polynomials, 2)
+    return integral_matrix_swapped.transpose(0, 2, 1).reshape(2*n_subapertures, n_polynomials).astype('float')
+
+
+def get_integral_matrix_pinv(integral_matrix: np.ndarray) -> np.ndarray:
+    """
+    Calculate the pseudo-inverse of the swapped integral matrix for the repeated solving of the equation S = E*Alpha.
+
+    Parameters
+    ----------
+    integral_matrix : np.ndarray
+        Integrals of Zernike polynomials on sub-apertures.
+
+    Returns
+    -------
+    np.ndarray
+        Pseudo-inverse matrix, the singular values less than 1E-6 (relative to the largest one) are treated as "0".
+
+    """
+    return pinv(swap_integral_matrix(integral_matrix), rcond=1E-6)
+
+
+def get_polynomials_coefficients(integral_matrix: np.ndarray, coms_shifts: np.ndarray,
+                                 integral_matrix_pinv: np.ndarray = None) -> np.ndarray:
     """
     Get the solution to the equation S = E*Alpha.
 
@@ -470,6 +509,8 @@ def get_polynomials_coefficients(integral_matrix: np.ndarray, coms_shifts: np.nd
         Integrals of Zernike polynomials on sub-apertures.
     coms_shifts : np.ndarray
         Shifts of center of masses coordinates for each focal spot of each sub-aperture.
+    integral_matrix_pinv : np.ndarray, optional
+        Precalculated by get_integral_matrix_pinv() pseudo-inverse of the integral matrix. The default is None.
 
     Returns
     -------
@@ -480,16 +521,13 @@ def get_polynomials_coefficients(integral_matrix: np.ndarray, coms_shifts: np.nd
     # alpha_coefficientsXY  = lstsq(integral_matrix, coms_shifts, rcond=1E-6)[0]  # Provides with solutions more than 1E-6, that is "0"
     # The matrices should be changed in sizes for calculation the alpha coefficients for each Zernike polynomial.
     # This made according to suggestion in the paper Dai G.-M., 1994
-    n_subapertures = np.size(coms_shifts, 0); n_polynomials = np.size(integral_matrix, 1) // 2
-    integral_matrix_swapped = np.zeros((2*n_subapertures, n_polynomials), dtype='float')
-    coms_shifts_swapped = np.zeros(2*n_subapertures, dtype='float')
-    for i in range(n_subapertures):
-        coms_shifts_swapped[2*i] = coms_shifts[i, 0]  # X values of all polynomials
-        coms_shifts_swapped[2*i+1] = coms_shifts[i, 1]  # Y values of all polynomials
-        for j in range(n_polynomials):
-            integral_matrix_swapped[2*i, j] = integral_matrix[i, 2*j]  # X values of all polynomials
-            integral_matrix_swapped[2*i+1, j] = integral_matrix[i, 2*j+1]   # Y values of all polynomials
-    alpha_coefficients = lstsq(integral_matrix_swapped, coms_shifts_swapped, rcond=1E-6)[0]  # Provides with solutions more than 1E-6
+    coms_shifts_swapped = np.ravel(coms_shifts[:, :2]).astype('float', copy=False)  # X and Y shifts of sub-apertures sequentially
+    if integral_matrix_pinv is not None:
+        alpha_coefficients = integral_matrix_pinv @ coms_shifts_swapped  # reuse of the pseudo-inverse matrix
+    else:
+        integral_matrix_swapped = swap_integral_matrix(integral_matrix)
+        # Provides with solutions more than 1E-6
+        alpha_coefficients = lstsq(integral_matrix_swapped, coms_shifts_swapped, rcond=1E-6)[0]
 
     return alpha_coefficients
 
@@ -559,6 +597,8 @@ def get_integral_limits_nonaberrated_centers(pics_folder: str = "pics", backgrou
                 if not os.path.isfile(nonaberratedPath):
                     raise Exception("Some of specified images are not actual files, check path and their names")
     # Open the stored files and extracting the recorded background from the wavefronts
+    from skimage import io
+    from skimage.util import img_as_ubyte
     nonaberrated = (io.imread(nonaberratedPath, as_gray=True))
     if subtract_background:
         # Subtracting from the recorded pictures (non- and aberrated) the recorded background
@@ -706,6 +746,8 @@ def get_coms_shifts(coms_nonaberrated: np.ndarray, integral_matrix: np.ndarray,
                 if not os.path.isfile(aberratedPath):
                     raise Exception("The aberrated image doesn't exist or not a file, check root path and its name")
     # Open the stored files and extracting the recorded background from the wavefronts
+    from skimage import io
+    from skimage.util import img_as_ubyte
     aberrated = (io.imread(aberratedPath, as_gray=True))
     if subtract_background:
         # Subtracting from the recorded pictures (non- and aberrated) the recorded background
@@ -10,12 +10,91 @@ It implements API functions provided in the IDS controlling library https://pypi
 
 """
 # %% Imports - global dependecies (from standard library and installed by conda / pip)
-from multiprocessing import Process, Queue
+from multiprocessing import Process, Queue, Event
+from multiprocessing.shared_memory import SharedMemory
 from queue import Empty, Full
 import time
 import numpy as np
 
 
+# %% Shared memory for images
+class SharedFramesRing:
+    """
+    Ring of preallocated shared memory buffers for passing U8 images from the camera Process without pickling them.
+
+    Only the small reference (slot, shape) to the written image is sent via the images Queue.
+    """
+
+    def __init__(self, max_height: int, max_width: int, n_slots: int = 8):
+        self.slot_size = max_height*max_width; self.n_slots = n_slots; self.index = 0
+        self.buffers = [SharedMemory(create=True, size=self.slot_size) for i in range(self.n_slots)]
+
+    def write(self, image: np.ndarray):
+        """
+        Copy the image to the next slot of the ring.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            Acquired image.
+
+        Returns
+        -------
+        tuple or np.ndarray
+            Reference to the written image as (slot, shape) or the image itself, if it doesn't fit into a slot.
+
+        """
+        if image.dtype != np.uint8 or image.size > self.slot_size:
+            return image  # it will be sent by the Queue as usual
+        slot = self.index; self.index = (self.index + 1) % self.n_slots
+        np.ndarray(image.shape, dtype=np.uint8, buffer=self.buffers[slot].buf)[...] = image
+        return (slot, image.shape)
+
+    def read(self, message, out: np.ndarray = None):
+        """
+        Copy out the image referenced by the message received from the images Queue.
+
+        Parameters
+        ----------
+        message : tuple or any
+            Reference (slot, shape) returned by write() or any other message (image, string).
+        out : np.ndarray, optional
+            Preallocated uint8 array for copying the image into, used if it has the same shape. The default is None.
+
+        Returns
+        -------
+        np.ndarray or any
+            Copy of the referenced image or the received message itself.
+
+        """
+        if isinstance(message, tuple) and len(message) == 2:
+            (slot, shape) = message
+            image = np.ndarray(shape, dtype=np.uint8, buffer=self.buffers[slot].buf)
+            if out is not None and out.shape == image.shape:
+                np.copyto(out, image); return out
+            return image.copy()
+        return message
+
+    def close(self, unlink: bool = False):
+        """
+        Close the access to the shared memory buffers.
+
+        Parameters
+        ----------
+        unlink : bool, optional
+            Free the shared memory, should be called once by the Process created the ring. The default is False.
+
+        Returns
+        -------
+        None.
+
+        """
+        for buffer in self.buffers:
+            buffer.close()
+            if unlink:
+                buffer.unlink()
+
+
 # %% Class wrapper
 class CameraWrapper(Process):
     """Class for wrapping controls of the IDS camera and provided API features."""
@@ -25,8 +104,11 @@ class CameraWrapper(Process):
     live_stream_flag: bool  # force type checking
 
     def __init__(self, messages_queue: Queue, exceptions_queue: Queue, images_queue: Queue, messages2caller: Queue,
-                 exposure_t_ms: int, image_width: int, image_height: int, camera_type: str = "Simulated"):
+                 exposure_t_ms: int, image_width: int, image_height: int, camera_type: str = "Simulated",
+                 frames_ring: SharedFramesRing = None, ready_event: Event = None):
         Process.__init__(self)  # Initialize this class on the separate process with its own memory and core
+        self.frames_ring = frames_ring  # If provided, images are written to it and only references to them are queued
+        self.ready_event = ready_event  # If provided, it's set then the camera initialized in the launched Process
         self.messages_queue = messages_queue  # For receiving the commands to stop / start live stream
         self.exceptions_queue = exceptions_queue  # For adding the exceptions that should stop the main program
         self.messages2caller = messages2caller  # For sending internal messages from this class for debugging
@@ -94,6 +176,8 @@ class CameraWrapper(Process):
                     if camera_status == ueye.IS_SUCCESS:
                         self.messages2caller.put_nowait("The IDS camera initialized")
                         self.initialized = True  # Additional flag for starting loop for processing commands
+                        if self.ready_event is not None:
+                            self.ready_event.set()  # notify the main GUI about initialization
                         self.images_queue.put_nowait("The IDS camera initialized")  # ???
                         # Setting the maximum (default) width and height
                         ueye.is_ResetToDefault(self.camera_reference)  # reset camera to default values
@@ -126,6 +210,8 @@ class CameraWrapper(Process):
 
             # Below - final confirmation that associated independent Process() launched (important for both cameras)
             self.messages2caller.put_nowait(self.camera_type + " camera Process has been launched")
+            if self.camera_type == "Simulated" and self.ready_event is not None:
+                self.ready_event.set()  # notify the main GUI about initialization
 
         # Below - the loop that receives the commands from GUI and initialize function to handle them
         while self.initialized:
@@ -224,12 +310,51 @@ class CameraWrapper(Process):
                                       self.bits_per_pixel, self.pitch, copy=True)
             # self.messages2caller.put_nowait("Status: " + str(status) + ", 1D array size: " + str(array.size))
             if array.size > 0:
-                image = np.reshape(array, (self.max_height.value, self.max_width.value, int(self.bits_per_pixel//8)))
-                self.images_queue.put_nowait(image)  # put the image to the queue for getting it in the main thread
+                self.put_image(self.reshape_frame(array))  # put the image to the queue for getting it in the main thread
         elif (self.camera_reference is None) and (self.camera_type == "IDS"):
             self.images_queue.put_nowait("String replacer of an image")
         elif self.camera_type == "Simulated":
             image = self.generate_noise_picture()  # No need to evoke try, because the width and height conformity already checked
+            self.put_image(image)
+
+    def reshape_frame(self, array: np.ndarray) -> np.ndarray:
+        """
+        Reshape the 1D array acquired from the IDS camera memory to the image.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            1D array returned by the IDS library.
+
+        Returns
+        -------
+        np.ndarray
+            2D image for monochrome pixels (1 byte per pixel), otherwise 3D with the last dimension for bytes.
+
+        """
+        n_bytes = int(self.bits_per_pixel//8)
+        if n_bytes == 1:
+            return np.reshape(array, (self.max_height.value, self.max_width.value))
+        else:
+            return np.reshape(array, (self.max_height.value, self.max_width.value, n_bytes))
+
+    def put_image(self, image: np.ndarray):
+        """
+        Put the acquired image (or the reference to it in the shared memory ring) to the images queue.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            Acquired image.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.frames_ring is not None:
+            self.images_queue.put_nowait(self.frames_ring.write(image))
+        else:
             self.images_queue.put_nowait(image)
 
     def live_imaging(self):
@@ -258,9 +383,7 @@ class CameraWrapper(Process):
                                                       self.max_height, self.bits_per_pixel,
                                                       self.pitch, copy=True)
                                 if array.size > 0:
-                                    image = np.reshape(array, (self.max_height.value, self.max_width.value,
-                                                               int(self.bits_per_pixel//8)))
-                                    self.images_queue.put_nowait(image)  # put the image to the queue for send it to GUI
+                                    self.put_image(self.reshape_frame(array))  # put the image to the queue for send it to GUI
                                     time.sleep(self.exposure_time_ms/50)  # artificial delay (IDS camera requires small exp.t.)
                             except Full:
                                 pass  # do nothing for now if the overloaded queue is tried to use
@@ -278,7 +401,7 @@ class CameraWrapper(Process):
             elif self.camera_type == "Simulated":
                 image = self.generate_noise_picture()  # simulate some noise image
                 if not self.images_queue.full():
-                    self.images_queue.put_nowait(image)
+                    self.put_image(image)
                 time.sleep(self.exposure_time_ms/1000)  # Delay due to the simulated exposure
             # Below - checking for the command "Stop Live stream"
             if not self.messages_queue.empty() and self.messages_queue.qsize() > 0:
@@ -10,7 +10,6 @@ Module for import into the camera GUI for performing periodically checks that th
 # %% Imports
 from threading import Thread
 from queue import Queue, Empty
-import time
 from multiprocessing import Queue as ProcessQueue
 
 
@@ -22,10 +21,10 @@ class ExceptionsChecker(Thread):
     If any exception is caught, then the Quit or Exit button will be clicked.
     """
 
-    def __init__(self, messages_queue: Queue, root_window, period_checks_ms: int = 100):
+    def __init__(self, messages_queue: Queue, root_window, period_checks_ms: int = 250):
         self.messages_queue = messages_queue; self.period_checks_ms = period_checks_ms
         if self.period_checks_ms < 5:
-            self.period_checks_ms = 5  # minimal delay between checks = 5 ms
+            self.period_checks_ms = 5  # minimal timeout of waiting for a message = 5 ms
         self.root_window = root_window
         Thread.__init__(self)
 
@@ -40,23 +39,22 @@ class ExceptionsChecker(Thread):
         """
         running = True; quit_flag = False
         while running:
-            if not self.messages_queue.empty() and self.messages_queue.qsize() > 0:
-                try:
-                    message = self.messages_queue.get_nowait()  # Getting immediately the message
-                    if isinstance(message, Exception):  # caught the exception
-                        print("Encountered and handled exception: ", message)
-                        # Should evoke all operations associated with clicked Quit button on the main window
-                        running = False; quit_flag = True
-                        break
-                    if isinstance(message, str):  # normal ending the running task
-                        if message == "Stop Exception Checker" or message == "Stop" or message == "Stop Program":
-                            # print("Exception checker stopped")
-                            running = False; break
-                        else:
-                            print("Some message caught by the Exception checker but not recognized")
-                except Empty:
-                    pass
-            time.sleep(self.period_checks_ms/1000)  # Artificial delays between each loop iteration
+            try:
+                # Thread sleeps until the message is put to the queue, timeout only for periodical checks
+                message = self.messages_queue.get(block=True, timeout=self.period_checks_ms/1000)
+            except Empty:
+                continue
+            if isinstance(message, Exception):  # caught the exception
+                print("Encountered and handled exception: ", message)
+                # Should evoke all operations associated with clicked Quit button on the main window
+                running = False; quit_flag = True
+                break
+            if isinstance(message, str):  # normal ending the running task
+                if message == "Stop Exception Checker" or message == "Stop" or message == "Stop Program":
+                    # print("Exception checker stopped")
+                    running = False; break
+                else:
+                    print("Some message caught by the Exception checker but not recognized")
         # Only now, if the loop has been ended because of caught Exception, call from the main window quit action
         if quit_flag:
             self.root_window.after(10, self.root_window.camera_ctrl_exit())  # Calling close protocol
@@ -71,10 +69,10 @@ class MessagesPrinter(Thread):
     This class is threaded for allowing simple printing in the IPython console of Spyder IDE.
     """
 
-    def __init__(self, messages_queue: ProcessQueue, period_checks_ms: int = 100):
+    def __init__(self, messages_queue: ProcessQueue, period_checks_ms: int = 250):
         self.messages_queue = messages_queue; self.period_checks_ms = period_checks_ms
         if self.period_checks_ms < 5:
-            self.period_checks_ms = 5  # minimal delay between checks = 5 ms
+            self.period_checks_ms = 5  # minimal timeout of waiting for a message = 5 ms
         Thread.__init__(self)
 
     def run(self):
@@ -88,20 +86,14 @@ class MessagesPrinter(Thread):
         """
         running = True
         while running:
-            if not self.messages_queue.empty() and self.messages_queue.qsize() > 0:
-                try:
-                    message = self.messages_queue.get_nowait()  # Getting immediately the message
-                    if isinstance(message, str):  # normal ending the running task
-                        if message == "Stop Messages Printer" or message == "Stop" or message == "Stop Program":
-                            # print("Messages Printer stopped")
-                            running = False; break
-                        # The condition below allows to prevent getting out the important message about
-                        # initialization process for only printing it but not processing
-                        elif "available" in message or "initialized" in message:
-                            self.messages_queue.put_nowait(message); time.sleep(2*self.period_checks_ms/1000)
-                        else:
-                            print(message)
-
-                except Empty:
-                    pass
-            time.sleep(self.period_checks_ms/1000)  # Artificial delays between each loop iteration
+            try:
+                # Thread sleeps until the message is put to the queue, timeout only for periodical checks
+                message = self.messages_queue.get(block=True, timeout=self.period_checks_ms/1000)
+            except Empty:
+                continue
+            if isinstance(message, str):  # normal ending the running task
+                if message == "Stop Messages Printer" or message == "Stop" or message == "Stop Program":
+                    # print("Messages Printer stopped")
+                    running = False; break
+                else:
+                    print(message)
@@ -21,18 +21,20 @@ from tkinter import font
 from tkinter.ttk import Progressbar
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import matplotlib.figure as plot_figure
+from matplotlib.collections import LineCollection
 import time
 import numpy as np
 import os
-from skimage import io
-from skimage.util import img_as_ubyte
-import re
-from queue import Queue, Empty
+from PIL import Image  # installed as the dependency of matplotlib
+from math import floor
+from queue import Queue, Empty, Full
 from pathlib import Path
 import platform
 import ctypes
-from multiprocessing import Queue as mpQueue
-from threading import Thread
+from multiprocessing import Queue as mpQueue, Event as mpEvent
+from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor, Future
+import weakref
 
 # %% Imports - local dependencies (modules / packages in the containing it folder / sub-folders)
 # print("Calling signature:", __name__)  # inspection of called signature
@@ -41,18 +43,20 @@ if __name__ == "__main__" or __name__ == Path(__file__).stem or __name__ == "__m
     from reconstruction_wfs_functions import (get_integral_limits_nonaberrated_centers, IntegralMatrixThreaded,
                                               get_localCoM_matrix, get_coms_shifts, get_zernike_coefficients_list,
                                               get_zernike_order_from_coefficients_number, get_coms_fast,
-                                              get_coms_shifts_fast)
-    from calc_zernikes_sh_wfs import get_polynomials_coefficients
-    from zernike_pol_calc import get_plot_zps_polar, zernike_polynomials_sum_tuned
+                                              get_coms_shifts_fast, load_from_npz, get_subregions_indices)
+    from calc_zernikes_sh_wfs import get_polynomials_coefficients, get_integral_matrix_pinv
+    from zernike_pol_calc import (get_plot_zps_polar, get_zernike_basis, get_cartesian_grid_indices,
+                                  zernike_polynomials_sum_tuned)
     import camera as cam  # for accessing controlling wrapper for the cameras (simulated and IDS)
 else:  # relative imports for resolving these dependencies in the case of import as module from a package
     from .reconstruction_wfs_functions import (get_integral_limits_nonaberrated_centers, IntegralMatrixThreaded,
                                                get_localCoM_matrix, get_coms_shifts,
                                                get_zernike_coefficients_list,
                                                get_zernike_order_from_coefficients_number, get_coms_fast,
-                                               get_coms_shifts_fast)
-    from .calc_zernikes_sh_wfs import get_polynomials_coefficients
-    from .zernike_pol_calc import get_plot_zps_polar, zernike_polynomials_sum_tuned
+                                               get_coms_shifts_fast, load_from_npz, get_subregions_indices)
+    from .calc_zernikes_sh_wfs import get_polynomials_coefficients, get_integral_matrix_pinv
+    from .zernike_pol_calc import (get_plot_zps_polar, get_zernike_basis, get_cartesian_grid_indices,
+                                   zernike_polynomials_sum_tuned)
     from . import camera as cam   # for accessing controlling wrapper for the cameras (simulated and IDS)
     # print("Implicit usage of camera module, list of importable modules: ", cam.__all__)
 
@@ -69,6 +73,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         self.config(takefocus=True)   # make created window in focus
         self.calibrate_window = None  # holder for checking if the window created
         self.calibrate_axes = None  # the class for plotting in figure loaded pictures
+        self.calibrate_axesimage = None  # the shown picture on calibrate_axes, updated by set_data() for a new picture
         self.loaded_image = None  # holder for the loaded image for calibration / reconstruction
         self.calibration = False  # flag for switching for a calibration window
         self.calibrate_plots = None  # flag for plots on an image - CoMs, etc.
@@ -76,14 +81,29 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         self.order = 4  # default selected Zernike order
         self.messages_queue = Queue(maxsize=10); self.integral_matrix = np.ndarray
         self.calculation_thread = None  # holder for calculation thread of integral matrix
+        self.integration_watcher = None  # holder for the thread waiting for the messages from the calculation thread
+        self.abort_event = Event()  # flag for stopping the calculation thread of integral matrix
         self.integration_running = False  # flag for tracing the running integration
         self.activate_load_aber_pic_count = 0  # if it == 2, then both files for reconstruction can be loaded
         self.loaded_axes = None; self.loaded_figure = None  # holders for opening and loading figures
         self.reconstruction_window = None  # holder for the top-level window representing the loaded picture
         self.reconstruction_axes = None; self.reconstruction_plots = None
+        self.reconstruction_axesimage = None  # the shown aberrated picture, updated by set_data() for a new picture
+        self.reconstruction_background = None  # cached rendered loaded image for restoring it without full redraw
+        self.coms_overlay = None  # persistent plot of localized focal spots, drawn above the cached image by blitting
         self.camera_ctrl_window = None  # holder for the top-level window controlling a camera
         self.default_font = font.nametofont("TkDefaultFont")
         self.coms_aberrated = None; self.coms_shifts = None
+        # Integral matrix for the aberrated spots and its pseudo-inverse in one tuple, reused while the matrix is the same.
+        # The tuple is replaced as a whole, so the live localization thread and the GUI thread read consistent pairs
+        self.pinv_cache = None
+        self.threshold_check_id = None; self.radius_check_id = None  # scheduled checks of the input values
+        # States of the files (path, modification time, size) with the weak references to the arrays loaded from them,
+        # for skipping repeated loading (the replaced arrays aren't kept alive by these references)
+        self.spots_file_loaded = None; self.integralM_file_loaded = None
+        self.zps_grid = None  # calculated sum of Zernike polynomials on the polar grid, reused for switching the colorbar
+        # Single background thread for loading files and calculations launched by the buttons, the GUI remains responsive
+        self.background_executor = ThreadPoolExecutor(max_workers=1)
 
         # Buttons and labels specification
         self.load_aber_pic_button = tk.Button(master=self, text="Load Aber.Picture",
@@ -121,6 +141,20 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         self.grid(); self.master.update()  # pack all buttons and labels
         self.master_geometry = self.master.winfo_geometry()  # saves the main window geometry
 
+    def get_main_window_geometry(self) -> tuple:
+        """
+        Get the size and position of the main window by the single request of its geometry.
+
+        Returns
+        -------
+        tuple
+            Width, height, x and y coordinates (in pixels) of the main window.
+
+        """
+        size, x, y = self.master.winfo_geometry().split("+")  # the geometry string formatted as "WxH+X+Y"
+        width, height = size.split("x")
+        return int(width), int(height), int(x), int(y)
+
     def set_default_path(self):
         """
         Check the existing of "calibrations" folder and set the default path representing to the user.
@@ -135,24 +169,32 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.default_path_display.insert('end', "Default path to calibration files: \n", ('header path',))
             self.default_path_display.tag_config('header path', justify=tk.CENTER)
             self.default_path_display.insert('end', self.calibration_path)
-            self.spots_path = os.path.join(self.calibration_path, "detected_focal_spots.npy")
-            self.integralM_path = os.path.join(self.calibration_path, "integral_calibration_matrix.npy")
-            if os.path.exists(self.spots_path):
+            self.calibrated_spots_path = os.path.join(self.calibration_path, "detected_focal_spots.npy")
+            # The compressed integral matrix is saved by this program, the *.npy one - by its previous versions
+            self.integralM_path = os.path.join(self.calibration_path, "integral_calibration_matrix.npz")
+            if not os.path.isfile(self.integralM_path):
+                self.integralM_path = os.path.join(self.calibration_path, "integral_calibration_matrix.npy")
+            # Files are opened directly, their absence reported by the raised exception (without preliminary checks)
+            try:
+                self.coms_spots = np.load(self.calibrated_spots_path)
+            except OSError:
+                self.spots_text.set("No default calibration file with spots found")
+            else:
                 self.spots_text.set("Calibration file with focal spots found")
-                self.coms_spots = np.load(self.spots_path)
+                self.spots_file_loaded = (self.get_file_state(self.calibrated_spots_path), weakref.ref(self.coms_spots))
                 rows, cols = self.coms_spots.shape
                 if rows > 0 and cols > 0:
                     self.activate_load_aber_pic_count += 1
+            try:
+                self.integral_matrix = self.read_integral_matrix(self.integralM_path)
+            except OSError:
+                self.integralM_text.set("No default calibration file with integral matrix found")
             else:
-                self.spots_text.set("No default calibration file with spots found")
-            if os.path.isfile(self.integralM_path):
                 self.integralM_text.set("Calibration file with integral matrix found")
-                self.integral_matrix = np.load(self.integralM_path)
+                self.integralM_file_loaded = (self.get_file_state(self.integralM_path), weakref.ref(self.integral_matrix))
                 rows, cols = self.integral_matrix.shape
                 if rows > 0 and cols > 0:
                     self.activate_load_aber_pic_count += 1
-            else:
-                self.integralM_text.set("No default calibration file with integral matrix found")
             if self.activate_load_aber_pic_count == 2:
                 self.load_aber_pic_button.config(state="normal")
         else:
@@ -172,11 +214,85 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         if self.camera_ctrl_window is not None:  # perform all required for closing camera ctrl operations
             self.camera_ctrl_exit()
         if self.calculation_thread is not None:
-            self.messages_queue.put_nowait("Stop integration")  # send the command for stopping calculation thread
+            self.abort_event.set()  # signal the calculation thread to stop
             if self.calculation_thread.is_alive():
                 self.calculation_thread.join(1)  # wait 1 sec for active thread stops
         if not self.messages_queue.empty():
             self.messages_queue.queue.clear()  # clear all messages from the messages queue
+        self.background_executor.shutdown(wait=False, cancel_futures=True)
+
+    def run_in_background(self, function, callback, *args, error_callback=None, **kwargs):
+        """
+        Submit the function to the background thread and call the callback with its result on the GUI thread.
+
+        Parameters
+        ----------
+        function : callable
+            Function performing I/O or calculations, it shouldn't access any GUI elements.
+        callback : callable
+            Method updating GUI, it receives the result returned by the function.
+        *args, **kwargs
+            Arguments for the function.
+        error_callback : callable, optional
+            Function without arguments restoring GUI (e.g., states of buttons) if the function raised an exception.
+            The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        task = self.background_executor.submit(function, *args, **kwargs)
+        self.after(10, self.check_background_task, task, callback, error_callback)
+
+    def check_background_task(self, task: Future, callback, error_callback=None):
+        """
+        Periodically check that the background task finished and pass its result to the callback.
+
+        Parameters
+        ----------
+        task : Future
+            Submitted to the background thread task.
+        callback : callable
+            Method updating GUI, it receives the result of the task.
+        error_callback : callable, optional
+            Function called instead of the callback if the task raised an exception. The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        if task.done():
+            if not task.cancelled():
+                error = task.exception()
+                if error is None:
+                    self.after_idle(callback, task.result())
+                else:
+                    print("Background task failed:", repr(error))
+                    if error_callback is not None:
+                        self.after_idle(error_callback)
+        else:
+            self.after(20, self.check_background_task, task, callback, error_callback)
+
+    def restore_button_state(self, button: tk.Button, state: str):
+        """
+        Restore the state of the button (e.g., disabled before the background task), if it still exists.
+
+        Parameters
+        ----------
+        button : tk.Button
+            Button on the GUI, it could be destroyed with its window.
+        state : str
+            State of the button ("normal" or "disabled").
+
+        Returns
+        -------
+        None.
+
+        """
+        if button.winfo_exists():
+            button.config(state=state)
 
     # %% Calibration
     def calibrate(self, camera_ctrl_call: bool = False):
@@ -195,8 +311,8 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         if self.calibrate_window is None:  # create the toplevel widget for holding all ctrls for calibration
             # Toplevel window configuration for calibration - relative to the main  (actual position!)
-            y_shift = self.master.winfo_geometry().split("+")[2]  # vertical shift
-            x_shift = self.master.winfo_x() + self.master.winfo_width() + self.pad  # horizontal shift
+            width, height, x, y_shift = self.get_main_window_geometry()
+            x_shift = x + width + self.pad  # horizontal shift
             self.calibrate_window = tk.Toplevel(master=self); self.calibrate_window.geometry(f'+{x_shift}+{y_shift}')
             self.calibrate_window.protocol("WM_DELETE_WINDOW", self.calibration_exit)  # associate quit with the function
             self.calibrate_button.config(state="disabled")  # disable the Calibrate button
@@ -257,6 +373,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             # Number of orders control
             self.zernike_orders = ["1st", "2nd", "3rd", "4th", "5th"]; self.selected_order = tk.StringVar()
             self.order_list = ["Use up to " + item + " order" for item in self.zernike_orders]
+            self.order_map = {option: i+1 for i, option in enumerate(self.order_list)}  # option string => Zernike order
             self.selected_order.set(self.order_list[3])
             self.zernike_order_selector = tk.OptionMenu(self.calibrate_window, self.selected_order, *self.order_list,
                                                         command=self.order_selected)
@@ -280,8 +397,8 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             if self.camera_ctrl_call:
                 self.calibrate_axes = self.calibrate_figure.add_subplot()
                 self.calibrate_axes.axis('off'); self.calibrate_figure.tight_layout()
-                self.calibrate_axes.imshow(self.current_image, cmap='gray', interpolation='none',
-                                           vmin=0, vmax=255)
+                self.calibrate_axesimage = self.calibrate_axes.imshow(self.current_image, cmap='gray', interpolation='none',
+                                                                      vmin=0, vmax=255)
                 self.calibrate_figure.subplots_adjust(left=0, bottom=0, right=1, top=1)  # remove white borders
                 self.calibrate_canvas.draw()
                 if len(self.current_image.shape) > 2:
@@ -331,7 +448,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.config(takefocus=True)   # make main window in focus
             # Below - restore empty holders for recreation of figure, axes, etc.
             self.calibration = False; self.loaded_image = None
-            self.calibrate_axes = None; self.calibrate_plots = None
+            self.calibrate_axes = None; self.calibrate_plots = None; self.calibrate_axesimage = None
             if not self.messages_queue.empty():
                 self.messages_queue.queue.clear()  # clear all messages from the messages queue
             self.calibrate_window.destroy(); self.calibrate_window = None
@@ -349,9 +466,6 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         self.calibrate_localize_button.config(state="normal")  # enable localization button after loading image
         self.pics_path = os.path.join(self.current_path, "pics")  # default folder with the pictures
-        if self.calibrate_axes is not None:
-            self.calibrate_figure.delaxes(self.calibrate_figure.get_axes()[0])
-            self.calibrate_axes = None
         # construct absolute path to the folder with recorded pictures
         if os.path.exists(self.pics_path) and os.path.isdir(self.pics_path):
             initialdir = self.pics_path
@@ -361,14 +475,20 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         open_image_dialog = tk.filedialog.askopenfile(initialdir=initialdir, filetypes=file_types)
         if open_image_dialog is not None:
             self.path_loaded_picture = open_image_dialog.name  # record absolute path to the opened image
-            self.loaded_image = io.imread(self.path_loaded_picture, as_gray=True)
-            self.loaded_image = img_as_ubyte(self.loaded_image)  # convert to the ubyte U8 image
+            self.loaded_image = self.read_ubyte_image(self.path_loaded_picture)
             if self.calibration:  # draw the loaded image in the opened calibration window (Toplevel)
                 if self.calibrate_axes is None:
                     self.calibrate_axes = self.calibrate_figure.add_subplot()  # add axes without dimension
                 if self.calibrate_axes is not None and self.loaded_image is not None:
-                    self.calibrate_axes.imshow(self.loaded_image, cmap='gray')
-                    self.calibrate_axes.axis('off'); self.calibrate_figure.tight_layout()
+                    if self.calibrate_axesimage is None:
+                        self.calibrate_axesimage = self.calibrate_axes.imshow(self.loaded_image, cmap='gray')
+                        self.calibrate_axes.axis('off'); self.calibrate_figure.tight_layout()
+                    else:
+                        # Reuse the shown image (extent and axes limits updated for the possibly changed picture size)
+                        self.remove_calibrate_plots()
+                        self.calibrate_axesimage.set_data(self.loaded_image); self.calibrate_axesimage.autoscale()
+                        height, width = self.loaded_image.shape[:2]
+                        self.calibrate_axesimage.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
                     self.calibrate_canvas.draw()  # redraw image in the widget (stored in canvas)
                     self.threshold_ctrl_box.config(state="normal")  # enable the threshold button
                     self.radius_ctrl_box.config(state="normal")  # enable the radius button
@@ -376,7 +496,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
     def validate_threshold(self, *args):
         """
-        Call checking function after some time of the first changing of threshold value.
+        Call checking function after some time of the last changing of threshold value.
 
         Parameters
         ----------
@@ -388,7 +508,10 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        self.after(920, self.check_threshold_value)  # call once the checking procedure of input value
+        # Call once the checking procedure of input value after the last change (e.g., after typing of all digits)
+        if self.threshold_check_id is not None:
+            self.after_cancel(self.threshold_check_id)
+        self.threshold_check_id = self.after(920, self.check_threshold_value)
 
     def check_threshold_value(self):
         """
@@ -399,6 +522,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
+        self.threshold_check_id = None
         try:
             input_value = self.threshold_value.get()
             if input_value < 1 or input_value > 255:  # bounds for an ubyte (U8) image
@@ -420,7 +544,9 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        self.after(920, self.check_radius_value)
+        if self.radius_check_id is not None:
+            self.after_cancel(self.radius_check_id)  # the previously scheduled check replaced by the one for the last value
+        self.radius_check_id = self.after(920, self.check_radius_value)
 
     def check_radius_value(self):
         """
@@ -431,6 +557,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
+        self.radius_check_id = None
         try:
             input_value = self.radius_value.get()
             if input_value < 1.0 or input_value > 100.0:  # bounds for an ubyte (U8) image
@@ -440,7 +567,9 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
     def redraw_loaded_image(self):
         """
-        Recreate the Axes instance and redraw originally loaded picture (without any additional plots on it).
+        Remove additional plots from the originally loaded picture (the picture itself isn't recreated).
+
+        The canvas is redrawn by the calling method after plotting the new CoMs and etc.
 
         Returns
         -------
@@ -450,12 +579,19 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         if self.calibrate_plots is None:  # upon the creation
             self.calibrate_plots = True
         else:
-            # Below - code for refreshing Axes class for again re-draw found CoMs and etc
-            self.calibrate_figure.delaxes(self.calibrate_figure.get_axes()[0])
-            self.calibrate_axes = self.calibrate_figure.add_subplot()
-            self.calibrate_axes.imshow(self.loaded_image, cmap='gray')
-            self.calibrate_axes.axis('off'); self.calibrate_figure.tight_layout()
-            self.calibrate_canvas.draw()  # redraw image in the widget (stored in canvas)
+            self.remove_calibrate_plots()
+
+    def remove_calibrate_plots(self):
+        """
+        Remove plotted found CoMs and sub-apertures from the calibration Axes.
+
+        Returns
+        -------
+        None.
+
+        """
+        for artist in [*self.calibrate_axes.lines, *self.calibrate_axes.patches]:
+            artist.remove()
 
     def localize_spots(self):
         """
@@ -518,8 +654,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        reg_digit = re.compile('\d')  # match any digit in a string
-        self.order = int(re.search(reg_digit, self.selected_order.get()).group(0))  # scan for number of Zernike order
+        self.order = self.order_map[self.selected_order.get()]  # number of Zernike order for the selected option
 
     def calculate_integral_matrix(self):
         """
@@ -530,13 +665,16 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        self.calculation_thread = IntegralMatrixThreaded(self.messages_queue, self.order, self.theta0, self.rho0,
+        self.abort_event.clear()  # reset the flag possibly set by the previous aborted calculation
+        self.calculation_thread = IntegralMatrixThreaded(self.messages_queue, self.abort_event, self.order,
+                                                         self.theta0, self.rho0,
                                                          self.integration_limits, self.radius_value.get(),
                                                          self.integration_progress_bar, self.integral_matrix)
         self.calculation_thread.start()
         self.integration_running = True
         self.save_integral_matrix_button.config(state="disabled")
-        self.after(500, self.check_finish_integration)
+        self.integration_watcher = Thread(target=self.watch_integration_messages, args=(self.calculation_thread,), daemon=True)
+        self.integration_watcher.start()
 
     def abort_integration(self):
         """
@@ -548,42 +686,64 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         if self.integration_running:
-            self.messages_queue.put_nowait("Stop integration")  # send the command for stopping calculation thread
+            self.abort_event.set()  # signal the calculation thread to stop
             self.save_integral_matrix_button.config(state="disabled")
             if self.calculation_thread is not None:  # checks that thread object still exists
                 if self.calculation_thread.is_alive():
                     self.calculation_thread.join(1)  # wait 1 sec for active thread stops
             self.integration_running = False
 
-    def check_finish_integration(self):
+    def watch_integration_messages(self, calculation_thread: IntegralMatrixThreaded):
         """
-        Check periodically whatever the calculation of integral matrix is finished or not.
+        Wait (on the separate thread) for the messages from the calculation thread and pass them to the GUI thread.
+
+        Parameters
+        ----------
+        calculation_thread : IntegralMatrixThreaded
+            Running calculation of the integral matrix.
 
         Returns
         -------
         None.
 
         """
-        if not self.messages_queue.empty():
+        while True:
             try:
-                message = self.messages_queue.get_nowait()
-                if message == "Integration finished":
-                    self.integration_running = False
-                    print("Integration matrix acquired and can be saved")
-                    self.integral_matrix = self.calculation_thread.integral_matrix
-                    if not isinstance(self.integral_matrix, list):
-                        rows, cols = self.integral_matrix.shape
-                        if rows > 0 and cols > 0:
-                            self.save_integral_matrix_button.config(state="normal")
-                if message == "Integration aborted":
-                    self.integration_running = False
-                    print(message); self.integral_matrix = []
-                elif message == "Stop integration":
-                    self.messages_queue.put_nowait(message); time.sleep(0.15)  # resend abort calculation
+                message = self.messages_queue.get(block=True, timeout=1.0)
             except Empty:
-                self.after(400, self.check_finish_integration)
-        else:
-            self.after(400, self.check_finish_integration)
+                if calculation_thread.is_alive():
+                    continue
+                else:
+                    break  # the calculation ended, but its message was removed from the queue (e.g., window closed)
+            self.after(0, self.integration_message_received, message)
+            if message == "Integration finished" or message == "Integration aborted":
+                break
+
+    def integration_message_received(self, message: str):
+        """
+        Handle the message from the calculation of integral matrix on the GUI thread.
+
+        Parameters
+        ----------
+        message : str
+            Message sent by the calculation thread.
+
+        Returns
+        -------
+        None.
+
+        """
+        if message == "Integration finished":
+            self.integration_running = False
+            print("Integration matrix acquired and can be saved")
+            self.integral_matrix = self.calculation_thread.integral_matrix
+            if not isinstance(self.integral_matrix, list):
+                rows, cols = self.integral_matrix.shape
+                if rows > 0 and cols > 0:
+                    self.save_integral_matrix_button.config(state="normal")
+        if message == "Integration aborted":
+            self.integration_running = False
+            print(message); self.integral_matrix = []
 
     def save_integral_matrix(self):
         """
@@ -596,12 +756,16 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         integralM_file = tk.filedialog.asksaveasfile(title="Save integral matrix",
                                                      initialdir=self.calibration_path,
-                                                     filetypes=[("numpy binary file", "*.npy")],
-                                                     defaultextension=".npy",
-                                                     initialfile="integral_calibration_matrix.npy")
+                                                     filetypes=[("numpy compressed archive", "*.npz"),
+                                                                ("numpy binary file", "*.npy")],
+                                                     defaultextension=".npz",
+                                                     initialfile="integral_calibration_matrix.npz")
         if integralM_file is not None:
             self.integral_matrix_path = integralM_file.name
-            np.save(self.integral_matrix_path, self.integral_matrix)
+            if self.integral_matrix_path.endswith(".npy"):
+                np.save(self.integral_matrix_path, self.integral_matrix)
+            else:
+                np.savez_compressed(self.integral_matrix_path, integral_matrix=self.integral_matrix)
             self.calibration_path, tail = os.path.split(self.integral_matrix_path)
             self.set_default_path()   # update the indicator of default detected spots path
 
@@ -623,18 +787,86 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
                                               initialdir=initialdir, filetypes=[("numpy binary file", "*.npy")],
                                               defaultextension=".npy", initialfile="detected_focal_spots.npy")
         if coms_file is not None:
+            if self.is_file_loaded(coms_file.name, self.spots_file_loaded, self.coms_spots):
+                return  # the same unchanged file is selected again, the spots loaded from it are still used
             self.calibrated_spots_path = coms_file.name
-            self.coms_spots = np.load(self.calibrated_spots_path)
-            rows, cols = self.coms_spots.shape
-            if rows > 0 and cols > 0:
-                # below - force the user to load the integral matrix again, if the file with spots reloaded
-                self.load_aber_pic_button.config(state="disabled")
-                if self.activate_load_aber_pic_count == 0 or self.activate_load_aber_pic_count == 1:
-                    self.activate_load_aber_pic_count += 1
-                elif self.activate_load_aber_pic_count == 2:
-                    self.activate_load_aber_pic_count -= 1
-            if self.activate_load_aber_pic_count == 2:
-                self.load_aber_pic_button.config(state="normal")
+            self.run_in_background(np.load, self.found_spots_loaded, self.calibrated_spots_path,
+                                   error_callback=lambda: self.spots_text.set("Selected file with spots not loaded"))
+
+    def get_file_state(self, path: str) -> tuple:
+        """
+        Get the normalized path to the file, its modification time and size for recognizing the same unchanged file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file.
+
+        Returns
+        -------
+        tuple
+            Normalized absolute path, modification time (in ns) and size (in bytes) of the file.
+
+        """
+        file_stat = os.stat(path)
+        return os.path.normcase(os.path.abspath(path)), file_stat.st_mtime_ns, file_stat.st_size
+
+    def is_file_loaded(self, path: str, file_loaded: tuple, array: np.ndarray) -> bool:
+        """
+        Check that the array has been loaded from the same unchanged file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the selected file.
+        file_loaded : tuple
+            State of the previously loaded file (returned by get_file_state()) and the weak reference to the array
+            loaded from it, or None.
+        array : np.ndarray
+            Currently used array (e.g., it could be replaced by the calculated one after loading).
+
+        Returns
+        -------
+        bool
+            True if the array is loaded from the same file, which hasn't been changed since then.
+
+        """
+        if file_loaded is None:
+            return False
+        loaded_array = file_loaded[1]()  # None, if the loaded array has been already released
+        if loaded_array is None or loaded_array is not array:
+            return False
+        try:
+            return file_loaded[0] == self.get_file_state(path)
+        except OSError:
+            return False
+
+    def found_spots_loaded(self, coms_spots: np.ndarray):
+        """
+        Assign the loaded in the background coordinates of focal spots and update the buttons states.
+
+        Parameters
+        ----------
+        coms_spots : np.ndarray
+            Coordinates of focal spots.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.coms_spots = coms_spots
+        self.spots_file_loaded = (self.get_file_state(self.calibrated_spots_path), weakref.ref(self.coms_spots))
+        rows, cols = self.coms_spots.shape
+        if rows > 0 and cols > 0:
+            # below - force the user to load the integral matrix again, if the file with spots reloaded
+            self.load_aber_pic_button.config(state="disabled")
+            if self.activate_load_aber_pic_count == 0 or self.activate_load_aber_pic_count == 1:
+                self.activate_load_aber_pic_count += 1
+            elif self.activate_load_aber_pic_count == 2:
+                self.activate_load_aber_pic_count -= 1
+        if self.activate_load_aber_pic_count == 2:
+            self.load_aber_pic_button.config(state="normal")
 
     def load_integral_matrix(self):
         """
@@ -650,21 +882,64 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         else:
             initialdir = self.current_path
         integralM_file = tk.filedialog.askopenfile(title="Load calculated integral matrix",
-                                                   initialdir=initialdir, filetypes=[("numpy binary file", "*.npy")],
-                                                   defaultextension=".npy", initialfile="integral_calibration_matrix.npy")
+                                                   initialdir=initialdir,
+                                                   filetypes=[("numpy compressed archive", "*.npz"),
+                                                              ("numpy binary file", "*.npy")],
+                                                   defaultextension=".npz", initialfile="integral_calibration_matrix.npz")
         if integralM_file is not None:
+            if self.is_file_loaded(integralM_file.name, self.integralM_file_loaded, self.integral_matrix):
+                return  # the same unchanged file is selected again, the matrix loaded from it is still used
             self.integralM_path = integralM_file.name
-            self.integral_matrix = np.load(self.integralM_path)
-            rows, cols = self.integral_matrix.shape
-            if rows > 0 and cols > 0:
-                # below - force the user to load the integral matrix again, if the file with spots reloaded
-                self.load_aber_pic_button.config(state="disabled")
-                if self.activate_load_aber_pic_count == 0 or self.activate_load_aber_pic_count == 1:
-                    self.activate_load_aber_pic_count += 1
-                elif self.activate_load_aber_pic_count == 2:
-                    self.activate_load_aber_pic_count -= 1
-            if self.activate_load_aber_pic_count == 2:
-                self.load_aber_pic_button.config(state="normal")
+            self.run_in_background(self.read_integral_matrix, self.integral_matrix_loaded, self.integralM_path,
+                                   error_callback=lambda: self.integralM_text.set("Selected file with integral matrix not loaded"))
+
+    def integral_matrix_loaded(self, integral_matrix: np.ndarray):
+        """
+        Assign the loaded in the background integral matrix and update the buttons states.
+
+        Parameters
+        ----------
+        integral_matrix : np.ndarray
+            Integral matrix.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.integral_matrix = integral_matrix
+        self.integralM_file_loaded = (self.get_file_state(self.integralM_path), weakref.ref(self.integral_matrix))
+        rows, cols = self.integral_matrix.shape
+        if rows > 0 and cols > 0:
+            # below - force the user to load the integral matrix again, if the file with spots reloaded
+            self.load_aber_pic_button.config(state="disabled")
+            if self.activate_load_aber_pic_count == 0 or self.activate_load_aber_pic_count == 1:
+                self.activate_load_aber_pic_count += 1
+            elif self.activate_load_aber_pic_count == 2:
+                self.activate_load_aber_pic_count -= 1
+        if self.activate_load_aber_pic_count == 2:
+            self.load_aber_pic_button.config(state="normal")
+
+    def read_integral_matrix(self, path: str) -> np.ndarray:
+        """
+        Read the integral matrix saved in the compressed *.npz archive or in the *.npy file.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path to the file with the integral matrix.
+
+        Returns
+        -------
+        np.ndarray
+            Integral matrix.
+
+        """
+        if path.endswith(".npz"):
+            return load_from_npz(path, "integral_matrix")
+        else:
+            # Read completely, not memory-mapped: the file could be overwritten by saving of the calculated matrix
+            return np.load(path)
 
     def load_aberrated_picture(self):
         """
@@ -676,10 +951,6 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         self.pics_path = os.path.join(self.current_path, "pics")  # default folder with the pictures
-        # Below - delete the plots (e.g., the localized focal spots)
-        if self.reconstruction_axes is not None:
-            self.reconstruction_figure.delaxes(self.reconstruction_figure.get_axes()[0])
-            self.reconstruction_axes = None
         # construct absolute path to the folder with recorded pictures
         if os.path.exists(self.pics_path) and os.path.isdir(self.pics_path):
             initialdir = self.pics_path
@@ -689,108 +960,183 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         open_image_dialog = tk.filedialog.askopenfile(initialdir=initialdir, filetypes=file_types)
         if open_image_dialog is not None:
             self.path_loaded_picture = open_image_dialog.name  # record absolute path to the opened image
-            self.loaded_image = io.imread(self.path_loaded_picture, as_gray=True)
-            self.loaded_image = img_as_ubyte(self.loaded_image)  # convert to the ubyte U8 image
-            rows, cols = self.loaded_image.shape
-            if rows > 0 and cols > 0:
-                # construct the toplevel window
-                if self.reconstruction_window is None:  # create the toplevel widget for holding all ctrls for calibration
-                    # Toplevel window configuration for reconstruction - relative to the main window actual position!
-                    y_shift = self.master.winfo_geometry().split("+")[2]  # vertical shift
-                    x_shift = self.master.winfo_x() + self.master.winfo_width() + self.pad  # horizontal shift
-                    self.reconstruction_window = tk.Toplevel(master=self)
-                    self.reconstruction_window.geometry(f'+{x_shift}+{y_shift}')
-                    self.reconstruction_window.protocol("WM_DELETE_WINDOW", self.reconstruction_exit)
-                    self.calibrate_button.config(state="disabled")  # disable the Calibrate button
-                    self.reconstruction_window.title("Reconstruction"); pad = 4
-
-                    # Buttons specification
-                    self.reconstruct_localize_button = tk.Button(master=self.reconstruction_window, text="Localize focal spots",
-                                                                 command=self.localize_aberrated_spots)
-                    self.reconstruct_get_shifts_button = tk.Button(master=self.reconstruction_window, text="Get shifts",
-                                                                   command=self.calculate_coms_shifts)
-                    self.reconstruct_get_shifts_button.config(state="disabled")
-                    self.reconstruct_get_zernikes_button = tk.Button(master=self.reconstruction_window, text="Get Aberrations",
-                                                                     command=self.calculate_zernikes_coefficients)
-                    self.reconstruct_get_zernikes_button.config(state="disabled")
-                    self.reconstruct_save_zernikes_plot = tk.Button(master=self.reconstruction_window, text="Save sum plot",
-                                                                    command=self.save_sum_reconstructed_zernikes)
-                    self.reconstruct_save_zernikes_plot.config(state="disabled")
-
-                    # Selector to show / hide a colorbar for polynomials plot
-                    self.colorbar_show_options = ["No colorbar", "Show colorbar"]
-                    self.colorbar_show_var = tk.StringVar()
-                    self.colorbar_show_var.set(self.colorbar_show_options[0])
-                    self.amplitude_show_selector = tk.OptionMenu(self.reconstruction_window,
-                                                                 self.colorbar_show_var,
-                                                                 *self.colorbar_show_options,
-                                                                 command=self.colobar_option_selected)
-                    self.amplitude_show_selector.config(state="disabled")
-
-                    # Construction of figure holder for its representation
-                    self.reconstruction_figure = plot_figure.Figure(figsize=(6.8, 5.7))
-                    self.reconstruction_canvas = FigureCanvasTkAgg(self.reconstruction_figure,
-                                                                   master=self.reconstruction_window)
-                    self.reconstruction_fig_widget = self.reconstruction_canvas.get_tk_widget()
-
-                    # Threshold value ctrls and packing
-                    self.threshold_frame = tk.Frame(master=self.reconstruction_window)  # for holding ctrls below
-                    self.threshold_label = tk.Label(master=self.threshold_frame, text="Threshold (1...254): ")
-                    self.threshold_label.pack(side='left', padx=1, pady=1)
-                    self.threshold_value = tk.IntVar(); self.threshold_value.set(self.default_threshold)
-                    self.threshold_value.trace_add(mode="write", callback=self.validate_threshold)
-                    self.threshold_ctrl_box = tk.Spinbox(master=self.threshold_frame, from_=1, to=254,
-                                                         increment=1, textvariable=self.threshold_value,
-                                                         wrap=True, width=4)   # adapt Spinbox to 4 digits in int
-                    self.threshold_ctrl_box.pack(side='left', padx=1, pady=1)
-
-                    # Radius of sub-apertures ctrls and packing
-                    self.radius_frame = tk.Frame(master=self.reconstruction_window)  # for holding ctrls below
-                    self.radius_label = tk.Label(master=self.radius_frame, text="Sub-aperture radius: ")
-                    self.radius_label.pack(side='left', padx=1, pady=1)
-                    self.radius_value = tk.DoubleVar(); self.radius_value.set(self.default_radius)
-                    self.radius_value.trace_add(mode="write", callback=self.validate_radius)
-                    self.radius_ctrl_box = tk.Spinbox(master=self.radius_frame, from_=1.0, to=100.0,
-                                                      increment=0.2, textvariable=self.radius_value,
-                                                      wrap=True, width=4)   # adapt Spinbox to 4 digits in double
-                    self.radius_ctrl_box.pack(side='left', padx=1, pady=1)
-
-                    # Place widgets on the Toplevel window
-                    self.reconstruct_localize_button.grid(row=0, rowspan=1, column=0, columnspan=1, padx=pad, pady=pad)
-                    self.threshold_frame.grid(row=0, rowspan=1, column=1, columnspan=1, padx=pad, pady=pad)
-                    self.radius_frame.grid(row=0, rowspan=1, column=2, columnspan=1, padx=pad, pady=pad)
-                    self.reconstruct_get_shifts_button.grid(row=0, rowspan=1, column=3, columnspan=1, padx=pad, pady=pad)
-                    self.reconstruct_get_zernikes_button.grid(row=0, rowspan=1, column=4, columnspan=1, padx=pad, pady=pad)
-                    self.reconstruction_fig_widget.grid(row=1, rowspan=4, column=0, columnspan=5, padx=pad, pady=pad)
-                    self.amplitude_show_selector.grid(row=5, rowspan=1, column=0, columnspan=1, padx=pad, pady=pad)
-                    self.reconstruct_save_zernikes_plot.grid(row=5, rowspan=1, column=4, columnspan=1, padx=pad, pady=pad)
-
-                    # Draw the loaded image
-                    if self.reconstruction_axes is None:
-                        self.reconstruction_axes = self.reconstruction_figure.add_subplot()  # add axes without dimension
-                    if self.reconstruction_axes is not None and self.loaded_image is not None:
-                        self.reconstruction_axes.imshow(self.loaded_image, cmap='gray')
-                        self.reconstruction_axes.axis('off'); self.reconstruction_figure.tight_layout()
-                        self.reconstruction_canvas.draw()  # redraw image in the widget (stored in canvas)
-                        # self.threshold_ctrl_box.config(state="normal")  # enable the threshold button
-                        # self.radius_ctrl_box.config(state="normal")  # enable the radius button
-                        self.reconstruction_plots = None
-
-                # Redraw reloaded image on the reconstruction window
-                else:  # the reconstruction window has been already opened
-                    if self.reconstruction_axes is None:
-                        self.reconstruction_axes = self.reconstruction_figure.add_subplot()  # add axes without dimension
-                    if self.reconstruction_axes is not None and self.loaded_image is not None:
-                        self.reconstruction_axes.imshow(self.loaded_image, cmap='gray')
-                        self.reconstruction_axes.axis('off'); self.reconstruction_figure.tight_layout()
-                        self.reconstruction_canvas.draw()  # redraw image in the widget (stored in canvas)
-                        # self.threshold_ctrl_box.config(state="normal")  # enable the threshold button
-                        # self.radius_ctrl_box.config(state="normal")  # enable the radius button
-                        self.reconstruction_plots = None
+            self.run_in_background(self.read_ubyte_image, self.aberrated_picture_loaded, self.path_loaded_picture)
         else:  # the new image not loaded, but the window remains with the previous image not active actually
             if self.reconstruction_window is not None:
                 self.reconstruction_exit()  # close previously opened toplevel window
 
+    def read_ubyte_image(self, path: str) -> np.ndarray:
+        """
+        Read the image from the specified path as the grayscale U8 image.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path to the image.
+
+        Returns
+        -------
+        np.ndarray
+            Loaded U8 image.
+
+        """
+        pixels = None
+        with Image.open(path) as image:
+            if image.mode == "L":
+                return np.array(image)  # already U8 grayscale, no conversions needed
+            elif image.mode in ("I;16", "I;16L", "I;16B"):
+                return (np.asarray(image) >> 8).astype(np.uint8)  # the same as img_as_ubyte() for U16 images
+            elif image.mode in ("RGB", "RGBA"):
+                pixels = np.multiply(np.asarray(image), 1.0/255.0)  # float64 image in the range [0, 1]
+        if pixels is not None:
+            # Color images - the same conversion as by io.imread(path, as_gray=True) and img_as_ubyte() from skimage
+            if pixels.shape[2] == 4:
+                alpha = pixels[:, :, 3:]  # blending of the color channels with the white background
+                pixels = np.clip((1.0 - alpha) + alpha*pixels[:, :, :3], 0.0, 1.0)
+            gray = pixels @ np.array([0.2125, 0.7154, 0.0721])  # luminance of the CRT phosphors
+            gray *= 255.0; np.rint(gray, out=gray)
+            return gray.astype(np.uint8)
+        # Other images (e.g., with a palette) - conversion to the grayscale by skimage functions
+        from skimage import io
+        from skimage.util import img_as_ubyte
+        return img_as_ubyte(io.imread(path, as_gray=True))  # convert to the ubyte U8 image
+
+    def aberrated_picture_loaded(self, loaded_image: np.ndarray):
+        """
+        Show the loaded in the background aberrated picture on the reconstruction window.
+
+        Parameters
+        ----------
+        loaded_image : np.ndarray
+            Loaded U8 image.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.loaded_image = loaded_image
+        rows, cols = self.loaded_image.shape
+        if rows > 0 and cols > 0:
+            # construct the toplevel window
+            if self.reconstruction_window is None:  # create the toplevel widget for holding all ctrls for calibration
+                # Toplevel window configuration for reconstruction - relative to the main window actual position!
+                width, height, x, y_shift = self.get_main_window_geometry()
+                x_shift = x + width + self.pad  # horizontal shift
+                self.reconstruction_window = tk.Toplevel(master=self)
+                self.reconstruction_window.geometry(f'+{x_shift}+{y_shift}')
+                self.reconstruction_window.protocol("WM_DELETE_WINDOW", self.reconstruction_exit)
+                self.calibrate_button.config(state="disabled")  # disable the Calibrate button
+                self.reconstruction_window.title("Reconstruction"); pad = 4
+
+                # Buttons specification
+                self.reconstruct_localize_button = tk.Button(master=self.reconstruction_window, text="Localize focal spots",
+                                                             command=self.localize_aberrated_spots)
+                self.reconstruct_get_shifts_button = tk.Button(master=self.reconstruction_window, text="Get shifts",
+                                                               command=self.calculate_coms_shifts)
+                self.reconstruct_get_shifts_button.config(state="disabled")
+                self.reconstruct_get_zernikes_button = tk.Button(master=self.reconstruction_window, text="Get Aberrations",
+                                                                 command=self.calculate_zernikes_coefficients)
+                self.reconstruct_get_zernikes_button.config(state="disabled")
+                self.reconstruct_save_zernikes_plot = tk.Button(master=self.reconstruction_window, text="Save sum plot",
+                                                                command=self.save_sum_reconstructed_zernikes)
+                self.reconstruct_save_zernikes_plot.config(state="disabled")
+
+                # Selector to show / hide a colorbar for polynomials plot
+                self.colorbar_show_options = ["No colorbar", "Show colorbar"]
+                self.colorbar_show_var = tk.StringVar()
+                self.colorbar_show_var.set(self.colorbar_show_options[0])
+                self.amplitude_show_selector = tk.OptionMenu(self.reconstruction_window,
+                                                             self.colorbar_show_var,
+                                                             *self.colorbar_show_options,
+                                                             command=self.colobar_option_selected)
+                self.amplitude_show_selector.config(state="disabled")
+
+                # Construction of figure holder for its representation
+                self.reconstruction_figure = plot_figure.Figure(figsize=(6.8, 5.7))
+                self.reconstruction_canvas = FigureCanvasTkAgg(self.reconstruction_figure,
+                                                               master=self.reconstruction_window)
+                self.reconstruction_fig_widget = self.reconstruction_canvas.get_tk_widget()
+
+                # Threshold value ctrls and packing
+                self.threshold_frame = tk.Frame(master=self.reconstruction_window)  # for holding ctrls below
+                self.threshold_label = tk.Label(master=self.threshold_frame, text="Threshold (1...254): ")
+                self.threshold_label.pack(side='left', padx=1, pady=1)
+                self.threshold_value = tk.IntVar(); self.threshold_value.set(self.default_threshold)
+                self.threshold_value.trace_add(mode="write", callback=self.validate_threshold)
+                self.threshold_ctrl_box = tk.Spinbox(master=self.threshold_frame, from_=1, to=254,
+                                                     increment=1, textvariable=self.threshold_value,
+                                                     wrap=True, width=4)   # adapt Spinbox to 4 digits in int
+                self.threshold_ctrl_box.pack(side='left', padx=1, pady=1)
+
+                # Radius of sub-apertures ctrls and packing
+                self.radius_frame = tk.Frame(master=self.reconstruction_window)  # for holding ctrls below
+                self.radius_label = tk.Label(master=self.radius_frame, text="Sub-aperture radius: ")
+                self.radius_label.pack(side='left', padx=1, pady=1)
+                self.radius_value = tk.DoubleVar(); self.radius_value.set(self.default_radius)
+                self.radius_value.trace_add(mode="write", callback=self.validate_radius)
+                self.radius_ctrl_box = tk.Spinbox(master=self.radius_frame, from_=1.0, to=100.0,
+                                                  increment=0.2, textvariable=self.radius_value,
+                                                  wrap=True, width=4)   # adapt Spinbox to 4 digits in double
+                self.radius_ctrl_box.pack(side='left', padx=1, pady=1)
+
+                # Place widgets on the Toplevel window
+                self.reconstruct_localize_button.grid(row=0, rowspan=1, column=0, columnspan=1, padx=pad, pady=pad)
+                self.threshold_frame.grid(row=0, rowspan=1, column=1, columnspan=1, padx=pad, pady=pad)
+                self.radius_frame.grid(row=0, rowspan=1, column=2, columnspan=1, padx=pad, pady=pad)
+                self.reconstruct_get_shifts_button.grid(row=0, rowspan=1, column=3, columnspan=1, padx=pad, pady=pad)
+                self.reconstruct_get_zernikes_button.grid(row=0, rowspan=1, column=4, columnspan=1, padx=pad, pady=pad)
+                self.reconstruction_fig_widget.grid(row=1, rowspan=4, column=0, columnspan=5, padx=pad, pady=pad)
+                self.amplitude_show_selector.grid(row=5, rowspan=1, column=0, columnspan=1, padx=pad, pady=pad)
+                self.reconstruct_save_zernikes_plot.grid(row=5, rowspan=1, column=4, columnspan=1, padx=pad, pady=pad)
+
+                # Draw the loaded image
+                self.show_aberrated_image(); self.reconstruction_plots = None
+
+            # Redraw reloaded image on the reconstruction window
+            else:  # the reconstruction window has been already opened
+                self.show_aberrated_image(); self.reconstruction_plots = None
+
+    def show_aberrated_image(self):
+        """
+        Show the loaded aberrated picture, reusing the Axes and the image on them if they're still on the figure.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.reconstruction_axesimage is None or self.reconstruction_background is None:
+            # Below - creation of Axes for the opened window or instead of the Zernike polynomials sum plot
+            self.reconstruction_figure.clear()
+            self.reconstruction_axes = self.reconstruction_figure.add_subplot()
+            self.reconstruction_axesimage = self.reconstruction_axes.imshow(self.loaded_image, cmap='gray')
+            self.reconstruction_axes.axis('off'); self.reconstruction_figure.tight_layout()
+            self.coms_overlay, = self.reconstruction_axes.plot([], [], '.', color="red", animated=True)
+        else:
+            # Reuse the shown image (extent and axes limits updated for the possibly changed picture size)
+            self.remove_reconstruction_plots()
+            self.reconstruction_axesimage.set_data(self.loaded_image); self.reconstruction_axesimage.autoscale()
+            height, width = self.loaded_image.shape[:2]
+            self.reconstruction_axesimage.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+        self.reconstruction_canvas.draw()  # immediate redraw, required for copying the rendered image below
+        self.reconstruction_background = self.reconstruction_canvas.copy_from_bbox(self.reconstruction_axes.bbox)
+
+    def remove_reconstruction_plots(self):
+        """
+        Remove plotted shifts of focal spots from the reconstruction Axes and clear the overlay with localized spots.
+
+        Returns
+        -------
+        None.
+
+        """
+        for artist in [*self.reconstruction_axes.lines, *self.reconstruction_axes.patches,
+                       *self.reconstruction_axes.collections]:
+            if artist is not self.coms_overlay:
+                artist.remove()
+        self.coms_overlay.set_data([], [])
+
     def redraw_aberrated_image(self):
         """
         Redraw loaded image without any plots on it.
@@ -803,13 +1149,13 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         # Redraw the image on the reconstruction window without any additional plots on it
         if self.reconstruction_plots is None:
             self.reconstruction_plots = True
+        elif self.reconstruction_background is not None:
+            # Remove previous plots (found CoMs, shifts) and blit the cached image instead of the full redraw
+            self.remove_reconstruction_plots()
+            self.reconstruction_canvas.restore_region(self.reconstruction_background)
+            self.reconstruction_canvas.blit(self.reconstruction_axes.bbox)
         else:
-            # Below - code for refreshing Axes class for again re-draw found CoMs and etc
-            self.reconstruction_figure.delaxes(self.reconstruction_figure.get_axes()[0])
-            self.reconstruction_axes = self.reconstruction_figure.add_subplot()
-            self.reconstruction_axes.imshow(self.loaded_image, cmap='gray')
-            self.reconstruction_axes.axis('off'); self.reconstruction_figure.tight_layout()
-            self.reconstruction_canvas.draw()  # redraw image in the widget (stored in canvas)
+            self.show_aberrated_image()  # refreshing Axes class (e.g., replaced by the Zernike polynomials sum plot)
 
     def localize_aberrated_spots(self):
         """
@@ -820,17 +1166,42 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        min_dist_peaks = int(np.round(1.5*self.radius_value.get(), 0))  # also used in imported reconstruction_wfs_functions
-        region_size = int(np.round(1.4*self.radius_value.get(), 0))  # also used in imported reconstruction_wfs_functions
-        self.coms_aberrated = get_localCoM_matrix(image=self.loaded_image, axes_fig=self.reconstruction_axes,
-                                                  threshold_abs=self.threshold_value.get(),
-                                                  min_dist_peaks=min_dist_peaks, region_size=region_size)
+        radius = self.radius_value.get()
+        min_dist_peaks = round(1.5*radius)  # also used in imported reconstruction_wfs_functions
+        region_size = round(1.4*radius)  # also used in imported reconstruction_wfs_functions
+        button = self.reconstruct_get_shifts_button; state = button['state']  # restored if the localization failed
+        button.config(state="disabled")  # wait for the localization finished
+        self.run_in_background(get_localCoM_matrix, self.aberrated_spots_localized, image=self.loaded_image,
+                               axes_fig=self.reconstruction_axes, threshold_abs=self.threshold_value.get(),
+                               min_dist_peaks=min_dist_peaks, region_size=region_size,
+                               error_callback=lambda: self.restore_button_state(button, state))
+
+    def aberrated_spots_localized(self, coms_aberrated: np.ndarray):
+        """
+        Plot the localized in the background focal spots on the aberrated image.
+
+        Parameters
+        ----------
+        coms_aberrated : np.ndarray
+            Coordinates of the localized focal spots.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.reconstruction_window is None:
+            return  # the reconstruction window closed during the localization
+        self.coms_aberrated = coms_aberrated
         self.redraw_aberrated_image()  # redraw the originally loaded image without any plots
         # Below - plotting found spots
         rows, cols = self.coms_aberrated.shape
         if rows > 0 and cols > 0:
-            self.reconstruction_axes.plot(self.coms_aberrated[:, 1], self.coms_aberrated[:, 0], '.', color="red")
-            self.reconstruction_canvas.draw()  # redraw image in the widget (stored in canvas)
+            # Draw only the found spots above the cached loaded image
+            self.coms_overlay.set_data(self.coms_aberrated[:, 1], self.coms_aberrated[:, 0])
+            self.reconstruction_canvas.restore_region(self.reconstruction_background)
+            self.reconstruction_axes.draw_artist(self.coms_overlay)
+            self.reconstruction_canvas.blit(self.reconstruction_axes.bbox)
             self.reconstruct_get_shifts_button.config(state="normal")
         # Disable some buttons for preventing of usage of previous calculation results
         if self.amplitude_show_selector['state'] == 'normal':
@@ -849,19 +1220,40 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         self.redraw_aberrated_image()  # redraw the originally loaded image without any plots
-        (self.coms_shifts, self.integral_matrix_aberrated,
-         self.coms_aberrated) = get_coms_shifts(self.coms_spots, self.integral_matrix,
-                                                self.coms_aberrated, self.radius_value.get())
+        button = self.reconstruct_get_zernikes_button; state = button['state']  # restored if the calculation failed
+        button.config(state="disabled")  # wait for the shifts calculated
+        self.run_in_background(get_coms_shifts, self.coms_shifts_calculated, self.coms_spots, self.integral_matrix,
+                               self.coms_aberrated, self.radius_value.get(),
+                               error_callback=lambda: self.restore_button_state(button, state))
+
+    def coms_shifts_calculated(self, calculation_results: tuple):
+        """
+        Plot the calculated in the background shifts of focal spots.
+
+        Parameters
+        ----------
+        calculation_results : tuple
+            Returned by get_coms_shifts function: shifts, integral matrix for the aberrated spots, aberrated CoMs.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.reconstruction_window is None:
+            return  # the reconstruction window closed during the calculation
+        (self.coms_shifts, self.integral_matrix_aberrated, self.coms_aberrated) = calculation_results
         # Plot shifts
         rows, cols = self.coms_aberrated.shape
         if rows > 0 and cols > 0:
-            for i in range(rows):
-                # Plotting the arrows for visual representation of shifts direction. Changed signs - because of swapped Y axis
-                self.reconstruction_axes.arrow(self.coms_aberrated[i, 1] - self.coms_shifts[i, 1],
-                                               self.coms_aberrated[i, 0] + self.coms_shifts[i, 0],
-                                               self.coms_shifts[i, 1], -self.coms_shifts[i, 0],
-                                               color='red', linewidth=4)
-            self.reconstruction_canvas.draw()  # redraw image in the widget (stored in canvas)
+            # Plotting all shifts by the single collection of segments, which end on the aberrated spots.
+            # Changed signs - because of swapped Y axis
+            starts = np.column_stack((self.coms_aberrated[:, 1] - self.coms_shifts[:, 1],
+                                      self.coms_aberrated[:, 0] + self.coms_shifts[:, 0]))
+            ends = np.column_stack((self.coms_aberrated[:, 1], self.coms_aberrated[:, 0]))
+            self.reconstruction_axes.add_collection(LineCollection(np.stack((starts, ends), axis=1), colors='red',
+                                                                   linewidths=4), autolim=False)
+            self.reconstruction_canvas.draw_idle()  # redraw image in the widget (stored in canvas) on the next idle Tk cycle
             self.reconstruct_get_zernikes_button.config(state="normal")
         # Disable some buttons for preventing of usage of previous calculation results
         if self.amplitude_show_selector['state'] == 'normal':
@@ -876,21 +1268,53 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
-        self.alpha_coefficients = get_polynomials_coefficients(self.integral_matrix_aberrated, self.coms_shifts)
+        self.zps_grid = None  # the previously calculated sum isn't valid for new coefficients
+        self.alpha_coefficients = self.get_alpha_coefficients(self.integral_matrix_aberrated, self.coms_shifts)
         self.alpha_coefficients *= np.pi  # for adjusting to radians ???
-        self.alpha_coefficients = list(self.alpha_coefficients)
         if len(self.alpha_coefficients) > 0:
             # Define below used orders of Zernikes and providing them for amplitudes calculation
             self.order = get_zernike_order_from_coefficients_number(len(self.alpha_coefficients))
             self.zernike_list_orders = get_zernike_coefficients_list(self.order)
-            # Draw the profile with Zernike polynomials multiplied by coefficients (amplitudes)
-            self.reconstruction_figure = get_plot_zps_polar(self.reconstruction_figure, orders=self.zernike_list_orders,
-                                                            step_r=0.005, step_theta=0.9,
-                                                            alpha_coefficients=self.alpha_coefficients, show_amplitudes=False)
-            self.reconstruction_canvas.draw()  # redraw the figure
+            self.zps_grid = zernike_polynomials_sum_tuned(self.zernike_list_orders, self.alpha_coefficients,
+                                                          step_r=0.005, step_theta=0.9)
+            # Draw the profile with Zernike polynomials multiplied by coefficients (amplitudes), the figure cleared and reused
+            get_plot_zps_polar(self.reconstruction_figure, orders=self.zernike_list_orders, step_r=0.005, step_theta=0.9,
+                               alpha_coefficients=self.alpha_coefficients, show_amplitudes=False, zps_grid=self.zps_grid)
+            self.reconstruction_background = None  # the loaded image replaced on the figure by the plot above
+            self.coms_overlay = None
+            self.reconstruction_canvas.draw_idle()  # redraw the figure on the next idle Tk cycle
             self.amplitude_show_selector.config(state="normal")
             self.reconstruct_save_zernikes_plot.config(state="normal")
 
+    def get_alpha_coefficients(self, integral_matrix_aberrated: np.ndarray, coms_shifts: np.ndarray) -> np.ndarray:
+        """
+        Calculate amplitudes of Zernike polynomials reusing the pseudo-inverse of the unchanged integral matrix.
+
+        Parameters
+        ----------
+        integral_matrix_aberrated : np.ndarray
+            Integral matrix for the matched aberrated focal spots.
+        coms_shifts : np.ndarray
+            Shifts of the matched focal spots.
+
+        Returns
+        -------
+        np.ndarray
+            Alpha coefficients (amplitudes) of Zernike polynomials.
+
+        """
+        # The pseudo-inverse matrix is recalculated only if other focal spots have been matched or calibration changed.
+        # If all spots are detected, the same integral matrix is returned each time and compared only by identity.
+        # The cache is read once: the matrix and its pseudo-inverse belong to the same call
+        pinv_cache = self.pinv_cache
+        if pinv_cache is not None and (pinv_cache[0] is integral_matrix_aberrated
+                                       or np.array_equal(pinv_cache[0], integral_matrix_aberrated)):
+            integral_matrix_pinv = pinv_cache[1]
+        else:
+            integral_matrix_pinv = get_integral_matrix_pinv(integral_matrix_aberrated)
+            self.pinv_cache = (integral_matrix_aberrated, integral_matrix_pinv)
+        return get_polynomials_coefficients(integral_matrix_aberrated, coms_shifts, integral_matrix_pinv)
+
     def colobar_option_selected(self, *args):
         """
         Draw or remove the colorbar on the profile with Zernike polynomials sum for representation of their amplitudes.
@@ -910,12 +1334,11 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         else:
             show_amplitudes = True
         if len(self.alpha_coefficients) > 0:
-            # Draw the profile with Zernike polynomials multiplied by coefficients (amplitudes)
-            self.reconstruction_figure = get_plot_zps_polar(self.reconstruction_figure, orders=self.zernike_list_orders,
-                                                            step_r=0.005, step_theta=0.9,
-                                                            alpha_coefficients=self.alpha_coefficients,
-                                                            show_amplitudes=show_amplitudes)
-            self.reconstruction_canvas.draw()  # redraw the figure
+            # Redraw the profile with Zernike polynomials multiplied by coefficients (amplitudes), reusing the calculated sum
+            get_plot_zps_polar(self.reconstruction_figure, orders=self.zernike_list_orders, step_r=0.005, step_theta=0.9,
+                               alpha_coefficients=self.alpha_coefficients, show_amplitudes=show_amplitudes,
+                               zps_grid=self.zps_grid)
+            self.reconstruction_canvas.draw_idle()  # redraw the figure on the next idle Tk cycle
 
     def save_sum_reconstructed_zernikes(self):
         """
@@ -948,6 +1371,8 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         self.calibrate_button.config(state="normal")
         self.reconstruction_window.destroy(); self.reconstruction_window = None
+        self.reconstruction_background = None; self.coms_overlay = None
+        self.reconstruction_axes = None; self.reconstruction_axesimage = None
 
     # %% Wavefront sensor Camera ctrl
     # recorded wavefront profiles from a Shack-Hartmann sensor
@@ -962,46 +1387,51 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         if self.camera_ctrl_window is None:
             # Toplevel window configuration for calibration - relative to the main window actual position!
-            y_shift = self.master.winfo_geometry().split("+")[2]  # vertical shift
+            width, height, x, y_shift = self.get_main_window_geometry()
             self.additional_bar_width = 150
-            # horizontal shift - below
-            x_shift = self.master.winfo_x() + self.master.winfo_width() + self.pad + self.additional_bar_width
+            x_shift = x + width + self.pad + self.additional_bar_width  # horizontal shift
             self.camera_ctrl_window = tk.Toplevel(master=self)
             self.camera_ctrl_window.geometry(f'+{x_shift}+{y_shift}')
             self.camera_ctrl_window.protocol("WM_DELETE_WINDOW", self.camera_ctrl_exit)
             self.global_timeout = 0.25  # global timeout in seconds
             self.frame_figure_axes = None; self.__flag_live_stream = False
             self.exposure_t_ms = 50; self.exposure_t_ms_min = 1; self.exposure_t_ms_max = 100
+            self.pending_exposure_t_setting = None  # scheduled sending of exposure time to the camera
             self.gui_refresh_rate_ms = 10  # The constant time pause between each attempt to retrieve the image
+            self.gui_refresh_rate_s = self.gui_refresh_rate_ms/1000  # precalculated for using in time.sleep() calls
+            self.snap_timeout_s = max(0.01, 2*self.exposure_t_ms/1000)  # waiting time for a single snap image
             self.calibration_activation = False  # for activating the button for calibration window open
             self.coms_shifts = None; self.coms_aberrated = None
             self.__flag_live_localization = False; self.reconstruction_updater = None
+            self.plots_idle = Event(); self.plots_idle.set()  # cleared while the localization Thread draws plots
+            self.localization_frames = Queue(maxsize=1)  # the newest live image for the localization Thread
+            self.print_timings = False  # for debugging, prints time of each live reconstruction
             self.__flag_live_image_updater = True  # default - for displaying live-streamed images
+            self.image_updater = None  # scheduled by Tk call for showing of live-streamed images
             self.__flag_update_amplitudes = False  # additional flag to stop updating the amplitudes
             self.amplitudes_figure = None; self.amplitudes_figure_axes = None
             self.amplitudes_showing = None; self.__flag_bar_plot = False
-            self.frame_figure_pcolormesh = None; self.frame_figure_colorbar = None
+            self.frame_figure_zernikes_sum = None; self.frame_figure_colorbar = None
+            self.zernike_basis = None; self.zernike_basis_orders = None  # precalculated polynomials for live sums
+            self.zernikes_sum_image = None  # image of the unit circle for showing of live sums
             self.show_coefficients_win = None; self.__flag_show_spots = False
-            self.plot_points = None
+            self.plot_points = None; self.last_coord = None; self.last_coord_str = ''  # cache for format_coord()
+            self.widget_states = {}  # last set states of controlling widgets, see set_widget_state()
 
             # Buttons creation
             self.single_snap_button = tk.Button(master=self.camera_ctrl_window, text="Snap single image",
                                                 command=self.snap_single_image)
-            self.single_snap_button.config(state="disabled")
             self.live_stream_button = tk.Button(master=self.camera_ctrl_window, text="Start Live",
                                                 command=self.live_stream, fg='green')
-            self.live_stream_button.config(state="disabled")
             self.cameras = ["Simulated", "IDS"]; self.selected_camera = tk.StringVar()
             self.selected_camera.set(self.cameras[0])
+            self.active_camera = self.cameras[0]  # cached selection, for not reading the tkinter variable each time
             self.camera_selector = tk.OptionMenu(self.camera_ctrl_window, self.selected_camera, *self.cameras,
                                                  command=self.switch_active_camera)
-            self.camera_selector.config(state="disabled")
             self.calibration_activate_button = tk.Button(master=self.camera_ctrl_window, text="Calibrate",
                                                          command=self.open_calibration, fg='blue')
-            self.calibration_activate_button.config(state="disabled")
             self.live_reconstruction_button = tk.Button(master=self.camera_ctrl_window, text="Start Reconstruction",
                                                         command=self.live_reconstruction, fg='magenta')
-            self.live_reconstruction_button.config(state="disabled")
             self.get_focal_spots_button = tk.Button(master=self.camera_ctrl_window, text="Start Localization",
                                                     command=self.live_localize_spots, fg='green')
 
@@ -1028,6 +1458,13 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
                                                     increment=0.2, textvariable=self.radius_value_lvRec,
                                                     wrap=True, width=4)   # adapt Spinbox to 4 digits in double
             self.radius_ctrl_box_lvRec.pack(side='left', padx=1, pady=1)
+            # Parameters used by the localization Thread are updated only if the user changes them
+            self.live_threshold = self.default_threshold; self.live_region_size = int(round(1.6*self.default_radius))
+            # Indices of pixels around calibrated spots, recalculated for other spots, image shape or region size
+            self.live_subregions_indices = None; self.live_subregions_key = None
+            self.live_coms_buffer = None; self.live_shifts_buffer = None  # reused for each frame arrays for CoMs and shifts
+            self.threshold_value_lvRec.trace_add(mode="write", callback=self.update_live_localization_parameters)
+            self.radius_value_lvRec.trace_add(mode="write", callback=self.update_live_localization_parameters)
 
             # Provide selection of reconstruction views - spots or reconstructed profile
             self.views = ["Detected Spots", "Coefficients"]; self.selected_view = tk.StringVar()
@@ -1045,21 +1482,26 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
                                                      wrap=True, width=4, command=self.set_exposure_t_ms)
             self.exposure_t_ms_selector.bind('<Return>', self.validate_exposure_t_input)  # validate input
             self.exposure_t_ms_label.pack(side=tk.LEFT); self.exposure_t_ms_selector.pack(side=tk.LEFT)
-            self.exposure_t_ms_selector.config(state="disabled")
+            self.apply_camera_ctrl_mode("initializing")  # all controls disabled until the camera initialized
 
             # Figure associated with live frame
             self.default_frame_figure = 6.0  # default figure size (in inches)
+            self.display_max_px = 800  # live images larger than it are subsampled for showing on the widget
             self.frame_figure = plot_figure.Figure(figsize=(self.default_frame_figure, self.default_frame_figure))
             self.canvas = FigureCanvasTkAgg(self.frame_figure, master=self.camera_ctrl_window); self.canvas.draw()
             self.frame_widget = self.canvas.get_tk_widget()
+            # Resizing changes the rendered axes, add the handler to the one that is set by FigureCanvasTkAgg
+            self.frame_widget.bind('<Configure>', self.invalidate_live_background, add='+')
             self.plot_toolbar = NavigationToolbar2Tk(self.canvas, self.camera_ctrl_window, pack_toolbar=False)
             self.plot_toolbar.update()
             # Assign subplot to the created figure
             if self.frame_figure_axes is None:
                 self.frame_figure_axes = self.frame_figure.add_subplot()
-                self.frame_figure_axes.axis('off'); self.frame_figure.tight_layout()
+                self.frame_figure_axes.axis('off')
                 self.frame_figure.subplots_adjust(left=0, bottom=0, right=1, top=1)  # remove white borders
             self.imshowing = None  # AxesImage instance
+            # Cached rendered axes for blitting of live images and these axes (they are replaced by switching views)
+            self.live_background = None; self.live_background_axes = None
 
             # Grid layout of all widgets
             self.camera_ctrl_pad = 4
@@ -1085,36 +1527,139 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.messages2Camera = mpQueue(maxsize=10)  # create message queue for communication with the camera
             self.camera_messages = mpQueue(maxsize=10)  # create message queue for listening from the camera
             self.exceptions_queue = mpQueue(maxsize=5)  # Initialize separate queue for handling Exceptions
-            self.images_queue = mpQueue(maxsize=40)  # Initialize the queue for holding acquired images
+            # Acquired images are passed in the shared memory, the queue holds only references to them.
+            # Its size is less than number of slots, so the image isn't overwritten before it's read from the ring
+            self.frames_ring = cam.cameras_ctrl.SharedFramesRing(2048, 2048)  # max sizes - for the IDS camera
+            self.images_queue = mpQueue(maxsize=self.frames_ring.n_slots-2)
+            self.camera_ready_event = mpEvent()  # set by the camera Process then the camera initialized
             self.image_height = 1000; self.image_width = 1000
+            self.allocate_image_buffers()
             self.camera_handle = cam.cameras_ctrl.CameraWrapper(self.messages2Camera, self.exceptions_queue,
                                                                 self.images_queue, self.camera_messages,
                                                                 self.exposure_t_ms, self.image_width,
                                                                 self.image_height,
-                                                                self.selected_camera.get())
+                                                                self.active_camera, self.frames_ring,
+                                                                self.camera_ready_event)
             self.camera_handle.start()  # start associated with the camera Process()
             # Wait the confirmation that camera initialized and Process launched
-            camera_initialized_flag = False; time.sleep(self.gui_refresh_rate_ms/1000)
-            while not camera_initialized_flag:
-                if not self.camera_messages.empty():
-                    try:
-                        message = self.camera_messages.get_nowait(); print(message)
-                        if message == "Simulated camera Process has been launched":
-                            self.single_snap_button.config(state="normal")
-                            self.live_stream_button.config(state="normal")
-                            self.camera_selector.config(state="normal")
-                            self.exposure_t_ms_selector.config(state="normal")
-                            camera_initialized_flag = True; break
-                    except Empty:
-                        pass
-                else:
-                    time.sleep(self.gui_refresh_rate_ms/1000)
+            if self.camera_ready_event.wait(timeout=6.0):
+                self.apply_camera_ctrl_mode("idle")
+            else:
+                print("Camera not initialized, timeout for initialization passed")
+            self.camera_ready_event.clear()
             # Exceptions and messeges handling - start associated Threads
             self.exceptions_checker = cam.check_exception_streams.ExceptionsChecker(self.exceptions_queue,
                                                                                     self)
             self.messages_printer = cam.check_exception_streams.MessagesPrinter(self.camera_messages)
             self.exceptions_checker.start(); self.messages_printer.start()
 
+    def send_to_camera(self, message) -> bool:
+        """
+        Send the command to the camera Process without preliminary checking of the messages queue state.
+
+        Parameters
+        ----------
+        message : str or tuple
+            Command or command with parameters.
+
+        Returns
+        -------
+        bool
+            True if the command has been put to the queue, False if the queue is full.
+
+        """
+        try:
+            self.messages2Camera.put_nowait(message); return True
+        except Full:
+            print("The command isn't sent to the camera, the queue is full:", message)
+            return False
+
+    def allocate_image_buffers(self):
+        """
+        Preallocate two buffers for copying acquired images into them in turn, instead of allocating each image.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.image_buffers = [np.zeros((self.image_height, self.image_width), dtype='uint8'),
+                              np.zeros((self.image_height, self.image_width), dtype='uint8')]
+        self.image_buffer_index = 0  # index of the buffer referenced by self.current_image
+
+    def get_image(self, message):
+        """
+        Get the image referenced by the message from the images queue, copying it into the free preallocated buffer.
+
+        Parameters
+        ----------
+        message : tuple or any
+            Message received from the images queue.
+
+        Returns
+        -------
+        np.ndarray or any
+            Acquired image or the received message itself.
+
+        """
+        # The localization Thread may still process the image in the buffer, so the separate copy is made for it
+        if self.__flag_live_localization:
+            return self.frames_ring.read(message)
+        free_buffer = self.image_buffers[self.image_buffer_index ^ 1]
+        image = self.frames_ring.read(message, out=free_buffer)
+        if image is free_buffer:
+            self.image_buffer_index ^= 1  # swap the buffers, the previous image isn't used anymore
+        return image
+
+    def set_widget_state(self, widget, state: str):
+        """
+        Set the state of the widget only if it differs from the last set one, it saves redundant calls to Tk.
+
+        Parameters
+        ----------
+        widget : tkinter widget
+            Button, Spinbox or OptionMenu from the camera control window.
+        state : str
+            "normal" or "disabled".
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.widget_states.get(widget) != state:
+            widget.config(state=state); self.widget_states[widget] = state
+
+    def apply_camera_ctrl_mode(self, mode: str):
+        """
+        Set states of all controlling widgets of the camera control window in one batch.
+
+        Parameters
+        ----------
+        mode : str
+            "initializing" (camera is (re-)initialized, all disabled), "idle" (camera is ready),
+            "streaming" (live stream is running) or "reconstructing" (live reconstruction is running).
+
+        Returns
+        -------
+        None.
+
+        """
+        idle = "normal" if mode == "idle" else "disabled"  # single snap, camera and exposure time selection
+        calibration = "normal" if self.calibration_activation and mode in ("idle", "streaming") else "disabled"
+        if mode == "reconstructing":
+            live_reconstruction = "normal"
+        elif mode == "idle" and self.active_camera == "IDS":
+            live_reconstruction = "normal"
+        else:
+            live_reconstruction = "disabled"  # live reconstruction isn't available for the simulated camera
+        live_stream = "normal" if mode in ("idle", "streaming") else "disabled"
+        self.set_widget_state(self.single_snap_button, idle); self.set_widget_state(self.camera_selector, idle)
+        self.set_widget_state(self.exposure_t_ms_selector, idle)
+        self.set_widget_state(self.live_stream_button, live_stream)
+        self.set_widget_state(self.calibration_activate_button, calibration)
+        self.set_widget_state(self.live_reconstruction_button, live_reconstruction)
+
     def snap_single_image(self):
         """
         Handle acquiring and representing of a single image.
@@ -1125,31 +1670,26 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         if self.camera_handle is not None:
-            if not self.messages2Camera.full():
-                self.messages2Camera.put_nowait("Snap single image")  # the command for acquiring single image
-                # timeout to wait the image on the imagesQueue
-                if self.exposure_t_ms > 5:
-                    timeout_wait = 2*self.exposure_t_ms
-                else:
-                    timeout_wait = 10
+            if self.send_to_camera("Snap single image"):  # the command for acquiring single image
                 try:
-                    # Waiting then image will be available
-                    image = self.images_queue.get(block=True, timeout=(timeout_wait/1000))
+                    # Waiting then image will be available, the timeout is updated then the exposure time changed
+                    image = self.get_image(self.images_queue.get(block=True, timeout=self.snap_timeout_s))
                 except Empty:
                     image = None
                     print("The snap image not acquired, timeout reached")
                 # Represent image on the figure (associated widget)
                 if not isinstance(image, str) and image is not None and isinstance(image, np.ndarray):
                     # Remove 3rd dimension from camera image for correct working of the cursor data update
-                    if len(image.shape) > 2:
-                        image = np.squeeze(image, axis=2)
+                    if image.ndim == 3:
+                        image = image[:, :, 0]
                     self.current_image = image  # save it as single element available for other Threads
+                    self.current_image_shape = image.shape[:2]  # cached for fast checks on mouse hovering
                     # For example, it will be available for Calibration and live spot detection
                     self.show_image(image)
                     # Activate below the button for calibration starting
                     if not self.calibration_activation:
                         self.calibration_activation = True
-                        self.calibration_activate_button.config(state="normal")
+                        self.set_widget_state(self.calibration_activate_button, "normal")
                 if isinstance(image, str):
                     print("Image: ", image)  # replacer for IDS simulation
 
@@ -1166,69 +1706,78 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         # Start Live Stream
         if self.__flag_live_stream:
             self.live_stream_button.config(text="Stop Live", fg='red')
-            self.single_snap_button.config(state="disabled")  # disabling the Single Frame acquisition
-            self.camera_selector.config(state="disabled")  # disabling selection of the active camera
-            self.exposure_t_ms_selector.config(state="disabled")
-            if self.selected_camera.get() == "IDS":
-                self.live_reconstruction_button.config(state="disabled")
+            # Disable the Single Frame acquisition, selection of the active camera and exposure time
+            self.apply_camera_ctrl_mode("streaming")
             self.plot_toolbar.grid_remove()  # remove toolbar from the widget
             self.frame_figure_axes.mouseover = False  # disable tracing mouse
             # self.imshowing.set_animated(True)  # tests say that it's unnecessary in this application
-            self.messages2Camera.put_nowait("Start Live Stream")  # Send this command to the wrapper class
-            # refresh of displayed images process => evoked Thread
-            self.image_updater = Thread(target=self.update_image, args=())
-            self.image_updater.start()  # start the Thread and assigned to it task
+            self.live_background = None  # the axes background will be cached with the 1st live image
+            self.send_to_camera("Start Live Stream")  # Send this command to the wrapper class
+            # refresh of displayed images - periodically scheduled call in the Tk event loop
+            self.image_update_period_ms = max(15, int(self.exposure_t_ms))
+            self.image_updater = self.camera_ctrl_window.after(self.image_update_period_ms, self.update_image)
         # Stop Live Stream
         else:
             if self.__flag_live_localization:
                 self.live_localize_spots()
-                time.sleep(5*self.gui_refresh_rate_ms/1000)  # additional delay for stopping reconstructions
-            if not self.messages2Camera.full():
-                self.messages2Camera.put_nowait("Stop Live Stream")  # Send the message to stop live stream
-                time.sleep(2*self.gui_refresh_rate_ms/1000)  # additional delay
-            self.live_stream_button.config(text="Start Live", fg='green')
-            self.single_snap_button.config(state="normal"); self.camera_selector.config(state="normal")
-            self.exposure_t_ms_selector.config(state="normal")
+                time.sleep(5*self.gui_refresh_rate_s)  # additional delay for stopping reconstructions
+            if self.image_updater is not None:
+                self.camera_ctrl_window.after_cancel(self.image_updater); self.image_updater = None
+            if self.send_to_camera("Stop Live Stream"):  # Send the message to stop live stream
+                time.sleep(2*self.gui_refresh_rate_s)  # additional delay
+            self.live_stream_button.config(text="Start Live", fg='green'); self.apply_camera_ctrl_mode("idle")
             self.frame_figure_axes.format_coord = self.format_coord
             self.frame_figure_axes.mouseover = True  # enable tracing mouse
             # Restore toolbar on the same place as before
             self.plot_toolbar.grid(row=6, rowspan=1, column=2, columnspan=3,
                                    padx=self.camera_ctrl_pad, pady=self.camera_ctrl_pad)
-            if self.selected_camera.get() == "IDS":
-                self.live_reconstruction_button.config(state="normal")
 
     def update_image(self):
         """
-        Target for running on separate Thread updating of images coming from a camera.
+        Show the newest image coming from a camera, it's periodically called by the Tk event loop during live streaming.
 
         Returns
         -------
         None.
 
         """
-        time.sleep(1.25*self.exposure_t_ms/1000)  # initial delay before querying for a new image from a queue
-        delay = 1.04*self.exposure_t_ms  # delay specification for stream of querying for a new image
-        while self.__flag_live_stream:
-            # t1 = time.perf_counter()
+        if not self.__flag_live_stream:
+            self.image_updater = None; return
+        # t1 = time.perf_counter()
+        # Get all already acquired images and show only the newest one, if the GUI is slower than a camera
+        image = None
+        while True:
             try:
-                image = self.images_queue.get_nowait()  # get new image from a queue
-                if not isinstance(image, str) and image is not None and isinstance(image, np.ndarray):
-                    # Remove 3rd dimension from camera image for correct working of the cursor data update
-                    if len(image.shape) > 2:
-                        image = np.squeeze(image, axis=2)
-                    self.current_image = image  # save it as single element available for other Threads
-                    # For example, it will be available for Calibration and live spot detection
-                    # Below flag - for switching off the live stream displaying
-                    if self.__flag_live_image_updater:
-                        self.show_image(image)  # call the function for image refreshing
-                    # Activate below the button for calibration starting
-                    if not self.calibration_activation:
-                        self.calibration_activation = True
-                        self.calibration_activate_button.config(state="normal")
+                message = self.images_queue.get_nowait()
             except Empty:
-                pass
-            time.sleep(delay/1000)
+                break
+            if not isinstance(message, str):
+                image = message
+        if image is not None:
+            image = self.get_image(image)  # copy out only the newest image from the shared memory
+            if isinstance(image, np.ndarray):
+                # Remove 3rd dimension from camera image for correct working of the cursor data update
+                if image.ndim == 3:
+                    image = image[:, :, 0]
+                self.current_image = image  # save it as single element available for other Threads
+                self.current_image_shape = image.shape[:2]  # cached for fast checks on mouse hovering
+                # For example, it will be available for Calibration and live spot detection
+                if self.__flag_live_localization:
+                    # Only the newest image is waiting for the localization Thread, the not processed one is dropped
+                    try:
+                        self.localization_frames.get_nowait()
+                    except Empty:
+                        pass
+                    self.localization_frames.put_nowait(image)
+                # Below flag - for switching off the live stream displaying
+                if self.__flag_live_image_updater:
+                    self.show_image(image)  # call the function for image refreshing
+                # Activate below the button for calibration starting
+                if not self.calibration_activation:
+                    self.calibration_activation = True
+                    self.set_widget_state(self.calibration_activate_button, "normal")
             # t2 = time.perf_counter(); print("Image showing takes:", round((t2-t1)*1000))
+        self.image_updater = self.camera_ctrl_window.after(self.image_update_period_ms, self.update_image)
 
     def show_image(self, image: np.ndarray):
         """
@@ -1247,7 +1796,7 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         # Initialize the AxesImage if this function called 1st time
         if image is not None and isinstance(image, np.ndarray) and self.imshowing is None:
             # Function below returns matplotlib.image.AxesImage class - need for further reference
-            if self.selected_camera.get() == "Simulated":
+            if self.active_camera == "Simulated":
                 color_map = 'gray'
             else:
                 color_map = 'plasma'
@@ -1258,10 +1807,34 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.imshowing.set_data(image)  # set data for AxesImage for updating image content
             self.canvas.draw()
         else:
-            # Calling backend canvas for re-drawing of updated image in the idle state (draw_idle())
-            # that is more effective than call self.canvas.draw()
+            # Subsampling of large images to the widget resolution, the extent of AxesImage keeps the full image sizes
+            k = max(image.shape[:2]) // self.display_max_px
+            if k > 1:
+                image = image[::k, ::k]
             self.imshowing.set_data(image)  # set data for AxesImage for updating image content
-            self.canvas.draw_idle()
+            if self.live_background is None or self.live_background_axes is not self.frame_figure_axes:
+                # Full rendering only for the 1st image on the axes, its background cached for blitting
+                self.canvas.draw()
+                self.live_background = self.canvas.copy_from_bbox(self.frame_figure_axes.bbox)
+                self.live_background_axes = self.frame_figure_axes
+            else:
+                # Only the image (and localized spots above it) re-rendered and blitted on the cached background
+                self.canvas.restore_region(self.live_background)
+                self.frame_figure_axes.draw_artist(self.imshowing)
+                if self.plot_points is not None:
+                    self.frame_figure_axes.draw_artist(self.plot_points[0])
+                self.canvas.blit(self.frame_figure_axes.bbox)  # the blitted region repainted synchronously
+
+    def invalidate_live_background(self, *args):
+        """
+        Reset the cached background for blitting of live images, it's called on resizing of the figure widget.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.live_background = None  # the background is cached again with the next full rendering
 
     def format_coord(self, x, y):
         """
@@ -1284,13 +1857,20 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             Formatted string that is shown by Navigation toolbar on the GUI.
 
         """
-        numrows, numcols = self.current_image.shape  # image sizes
-        x = int(round(x, 0)); y = int(round(y, 0))  # according the Reference above
+        numrows, numcols = self.current_image_shape  # image sizes
+        x = floor(x + 0.5); y = floor(y + 0.5)  # according the Reference above, pixel centers have integer coordinates
         if 0 <= x < numcols and 0 <= y < numrows:
-            z = self.current_image[y, x]
-            return 'x=%1.0f, y=%1.0f \n [%1.0f]' % (x, y, z)
+            coord = (x, y, int(self.current_image[y, x]))
         else:
-            return 'x=%1.0f, y=%1.0f' % (x, y)
+            coord = (x, y, None)
+        # Rebuild the string only if the pointed pixel or its value changed since the previous mouse event
+        if coord != self.last_coord:
+            self.last_coord = coord
+            if coord[2] is not None:
+                self.last_coord_str = f'x={x}, y={y}\n [{coord[2]}]'
+            else:
+                self.last_coord_str = f'x={x}, y={y}'
+        return self.last_coord_str
 
     def close_current_camera(self):
         """
@@ -1305,18 +1885,17 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             # If there is live-streaming going on, just first call the function to stop it
             if self.__flag_live_stream:
                 self.live_stream()
-                time.sleep(2*self.gui_refresh_rate_ms/1000)  # additional delay
+                time.sleep(2*self.gui_refresh_rate_s)  # additional delay
             # Disable all controlling buttons
-            self.single_snap_button.config(state="disabled"); self.live_stream_button.config(state="disabled")
-            self.camera_selector.config(state="disabled"); time.sleep(self.gui_refresh_rate_ms/1000)
+            self.apply_camera_ctrl_mode("initializing"); time.sleep(self.gui_refresh_rate_s)
             # Send the message to stop the imaging and deinitialize the camera:
-            self.messages2Camera.put_nowait("Close the camera"); time.sleep(self.gui_refresh_rate_ms/1000)
+            self.send_to_camera("Close the camera"); time.sleep(self.gui_refresh_rate_s)
             if self.camera_handle.is_alive():  # if the associated with the camera Process hasn't been finished
                 self.camera_handle.join(timeout=self.global_timeout)  # wait the camera closing / deinitializing
                 print("Camera process released")
             self.camera_handle = None  # for preventing again checking if it's alive
             # Print out all collected messages
-            while not self.camera_messages.empty():
+            while True:
                 try:
                     print(self.camera_messages.get_nowait())
                 except Empty:
@@ -1336,108 +1915,74 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         None.
 
         """
+        self.active_camera = selected_camera
         # Clear the buffer with images
-        if not self.images_queue.empty():
-            for i in range(self.images_queue.qsize()):
-                try:
-                    self.images_queue.get_nowait()
-                except Empty:
-                    break
+        while True:
+            try:
+                self.images_queue.get_nowait()
+            except Empty:
+                break
         self.close_current_camera()  # close the previously active camera
-        print("Selected camera:", self.selected_camera.get())
+        print("Selected camera:", self.active_camera)
         # Changing default exposure time for usability of the IDS camera
         if selected_camera == "IDS":
             self.exposure_t_ms = 2; self.exposure_t_ms_ctrl.set(2)
         else:
             self.exposure_t_ms = 50; self.exposure_t_ms_ctrl.set(50)
+        self.snap_timeout_s = max(0.01, 2*self.exposure_t_ms/1000)
         # Initialize again the camera and associated Process
         self.camera_handle = cam.cameras_ctrl.CameraWrapper(self.messages2Camera, self.exceptions_queue,
                                                             self.images_queue, self.camera_messages,
                                                             self.exposure_t_ms, self.image_width, self.image_height,
-                                                            self.selected_camera.get())
-        if self.selected_camera.get() == "Simulated":
+                                                            self.active_camera, self.frames_ring,
+                                                            self.camera_ready_event)
+        if self.active_camera == "Simulated":
             self.camera_handle.start()  # start associated with the camera Process()
-            self.live_reconstruction_button.config(state="disabled")  # disable reconstruction for simulations
+        # The controlling IDS library and connected camera are checked during initialization of the wrapper class
+        elif self.camera_handle.initialized:
+            self.camera_handle.start()  # start associated Process()
         else:
-            time.sleep(self.gui_refresh_rate_ms/1000)
+            print("IDS camera not initialized, see the reported by it messages")
+            self.camera_handle = None
         # Wait the confirmation that camera initialized
-        camera_initialized_flag = False; time.sleep(self.gui_refresh_rate_ms/1000)
-        if 0 < self.gui_refresh_rate_ms < 1000:
-            attempts = 6000//self.gui_refresh_rate_ms  # number of attempts to receive initialized message ~ 6 sec.
-        else:
-            attempts = 600
-        i = 0  # counting attempts
-        wait_camera = False  # for separate 2 events: import controlling library and confirmation from a camera
-        while not camera_initialized_flag and i <= attempts:
-            if not self.camera_messages.empty():
-                try:
-                    message = self.camera_messages.get_nowait()
-                    if self.selected_camera.get() == "Simulated":
-                        print(message)
-                        if message == "Simulated camera Process has been launched":
-                            camera_initialized_flag = True; break
-                        else:
-                            time.sleep(self.gui_refresh_rate_ms/1000); i += 1
-                    else:
-                        # print("Message from IDS camera:", message)
-                        # This case - for looking for initial import success of controlling IDS library
-                        if not wait_camera:
-                            if message == "IDS controlling library and camera are both available":
-                                wait_camera = True; self.camera_handle.start()  # start associated Process()
-                                time.sleep(5*self.gui_refresh_rate_ms/1000)
-                            else:
-                                print("IDS camera not initialized, it reports:", message)
-                                camera_initialized_flag = False; self.camera_handle = None
-                                time.sleep(2*self.gui_refresh_rate_ms/1000); break
-                        # This case - for waiting the confirmation, that camera initialized
-                        else:
-                            # print("Waiting confirmation from IDS camera and received: ", message)
-                            if message == "The IDS camera initialized":
-                                camera_initialized_flag = True; break
-                            else:
-                                time.sleep(self.gui_refresh_rate_ms/1000); i += 1
-                except Empty:
-                    time.sleep(self.gui_refresh_rate_ms/1000); i += 1
-            else:
-                time.sleep(self.gui_refresh_rate_ms/1000); i += 1
-        # Below - handle if the IDS camera cannot be initialized
-        if i > attempts and not camera_initialized_flag:
-            print("Camera not initialized, timeout for initialization passed")
-            self.camera_handle = None  # prevent to send to simulated camera close command
+        camera_initialized_flag = False
+        if self.camera_handle is not None:
+            camera_initialized_flag = self.camera_ready_event.wait(timeout=6.0); self.camera_ready_event.clear()
+            if not camera_initialized_flag:
+                print("Camera not initialized, timeout for initialization passed")
+                self.camera_handle = None  # prevent to send to simulated camera close command
         # Below case - IDS camera library not installed or camera not connected or something else wrong
-        if self.selected_camera.get() == "IDS" and not camera_initialized_flag:
+        if self.active_camera == "IDS" and not camera_initialized_flag:
             self.selected_camera.set("Simulated"); self.switch_active_camera("Simulated")
             self.exposure_t_ms = 50; self.exposure_t_ms_ctrl.set(50)
         # Change the accepted range for the Exposure time for IDS camera
-        if self.selected_camera.get() == "IDS" and camera_initialized_flag:
+        if self.active_camera == "IDS" and camera_initialized_flag:
             self.exposure_t_ms_min = 0.01; self.exposure_t_ms_max = 100
             self.exposure_t_ms_selector.config(from_=self.exposure_t_ms_min, to=self.exposure_t_ms_max,
                                                increment=self.exposure_t_ms_min, width=5)
-            self.live_reconstruction_button.config(state="normal")
-        # Below case - everything is ok, activate back buttons
+        # Below case - everything is ok, activate back buttons (live reconstruction - only for IDS camera)
         if camera_initialized_flag:
-            self.single_snap_button.config(state="normal"); self.live_stream_button.config(state="normal")
-            self.camera_selector.config(state="normal")
+            self.apply_camera_ctrl_mode("idle")
 
         # Configuration of color map for image show (if the switching between cameras happen)
         if self.imshowing is not None:
-            # It's necessary to delete previous axes (subplot) for fully refresh the image and toolbar!
-            self.frame_figure.clear()  # clear all axes
-            self.frame_figure_axes = self.frame_figure.add_subplot()  # create new axis!
-            self.frame_figure_axes.axis('off'); self.frame_figure.tight_layout()
-            self.frame_figure.subplots_adjust(left=0, bottom=0, right=1, top=1)  # remove white borders
             # Set the zero image after the switching of camera
-            if self.selected_camera.get() == "IDS":
+            if self.active_camera == "IDS":
                 # Default for IDS camera sizes = 2048x2048, hard-coded now, but it reports this in the init. message
                 self.image_width = 2048; self.image_height = 2048; color_map = 'plasma'
             else:
                 self.image_width = 1000; self.image_height = 1000; color_map = 'gray'
 
             # Update blank image for picking up by toolbar right dimensions sizes
-            self.current_image = np.zeros((self.image_width, self.image_height), dtype='uint8')
-            self.imshowing = self.frame_figure_axes.imshow(self.current_image, cmap=color_map,
-                                                           interpolation='none', vmin=0, vmax=255)
-            self.canvas.draw(); self.frame_widget.update(); self.plot_toolbar.update()
+            self.allocate_image_buffers(); self.current_image = self.image_buffers[0]
+            self.current_image_shape = self.current_image.shape
+            # Update in place the shown image and its sizes instead of re-creation of axes
+            self.imshowing.set_cmap(color_map); self.imshowing.set_data(self.current_image)
+            self.imshowing.set_extent((-0.5, self.image_width-0.5, self.image_height-0.5, -0.5))
+            self.frame_figure_axes.set_xlim(-0.5, self.image_width-0.5)
+            self.frame_figure_axes.set_ylim(self.image_height-0.5, -0.5)
+            self.live_background = None  # the cached axes background isn't valid anymore
+            self.canvas.draw_idle(); self.plot_toolbar.update()  # the toolbar forgets views of the previous image
 
     def validate_exposure_t_input(self, *args):
         """
@@ -1468,28 +2013,43 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         Set exposure time for the active camera.
 
+        The value is sent after a short delay, so only the last value is sent during fast clicking on the Spinbox arrows.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.pending_exposure_t_setting is not None:
+            self.camera_ctrl_window.after_cancel(self.pending_exposure_t_setting)
+        self.pending_exposure_t_setting = self.camera_ctrl_window.after(150, self.send_exposure_t_ms)
+
+    def send_exposure_t_ms(self):
+        """
+        Send the selected exposure time to the active camera.
+
         Returns
         -------
         None.
 
         """
+        self.pending_exposure_t_setting = None
         self.exposure_t_ms = self.exposure_t_ms_ctrl.get()
+        self.snap_timeout_s = max(0.01, 2*self.exposure_t_ms/1000)
         # below - send the tuple with string command and exposure time value
-        if not self.messages2Camera.full():
-            self.messages2Camera.put_nowait(("Set exposure time", self.exposure_t_ms))
-        if self.selected_camera.get() == "Simulated":
-            time.sleep(self.gui_refresh_rate_ms/2000)
+        self.send_to_camera(("Set exposure time", self.exposure_t_ms))
+        if self.active_camera == "Simulated":
+            time.sleep(0.5*self.gui_refresh_rate_s)
         else:
             # Get actual set exposure time
-            time.sleep((2*self.gui_refresh_rate_ms)/1000)
-            if not self.camera_messages.empty():
-                try:
-                    # Checking the answer about actually set exposure time from the camera
-                    message = self.camera_messages.get_nowait()
-                    exp_t = message.split(":")[1]; exp_t = round(float(exp_t), 2)
-                    self.exposure_t_ms_ctrl.set(exp_t); print(message)
-                except Empty:
-                    pass
+            time.sleep(2*self.gui_refresh_rate_s)
+            try:
+                # Checking the answer about actually set exposure time from the camera
+                message = self.camera_messages.get_nowait()
+                exp_t = message.split(":")[1]; exp_t = round(float(exp_t), 2)
+                self.exposure_t_ms_ctrl.set(exp_t); print(message)
+            except Empty:
+                pass
 
     def open_calibration(self):
         """
@@ -1515,14 +2075,12 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         self.live_stream()  # call to the live stream initialization or stop
-        self.live_reconstruction_button.config(state="normal")  # because it's disabled by self.live_stream()
         # Disable / enable calibration feature and Stop Live / Start Live + put additional controls
         if self.__flag_live_stream:
+            self.apply_camera_ctrl_mode("reconstructing")
             self.live_reconstruction_button.config(text="Stop Reconstruction", fg='red',
                                                    padx=self.camera_ctrl_pad, pady=self.camera_ctrl_pad)
             self.get_focal_spots_button.config(text="Start Localization", fg='green')
-            self.live_stream_button.config(state="disabled")
-            self.calibration_activate_button.config(state="disabled")
             self.get_focal_spots_button.grid(row=6, rowspan=1, column=1, columnspan=1,
                                              padx=self.camera_ctrl_pad, pady=self.camera_ctrl_pad)
             self.threshold_frame_lvRec.grid(row=6, rowspan=1, column=2, columnspan=1,
@@ -1532,10 +2090,29 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         else:
             # Buttons show / hide
             self.live_reconstruction_button.config(text="Start Reconstruction", fg='magenta')
-            self.live_stream_button.config(state="normal"); self.radius_frame_lvRec.grid_remove()
-            self.calibration_activate_button.config(state="normal"); self.view_selector.grid_remove()
+            self.radius_frame_lvRec.grid_remove(); self.view_selector.grid_remove()  # buttons enabled by live_stream()
             self.get_focal_spots_button.grid_remove(); self.threshold_frame_lvRec.grid_remove()
 
+    def update_live_localization_parameters(self, *args):
+        """
+        Update the threshold and region size used for live localization of focal spots after their changing by the user.
+
+        Parameters
+        ----------
+        *args : several values provided by IntVar / DoubleVar tkinter.
+            There are a few parameters associated with these variables.
+
+        Returns
+        -------
+        None.
+
+        """
+        try:
+            self.live_threshold = self.threshold_value_lvRec.get()
+            self.live_region_size = int(round(1.6*self.radius_value_lvRec.get()))
+        except tk.TclError:
+            pass  # not completed input in a Spinbox, previous values are kept
+
     def live_localize_spots(self):
         """
         Launch the localization of focal spots on the separate thread.
@@ -1546,11 +2123,16 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         self.__flag_live_localization = not self.__flag_live_localization
-        time.sleep(4*self.gui_refresh_rate_ms/1000)
+        time.sleep(4*self.gui_refresh_rate_s)
         if self.__flag_live_stream and self.__flag_live_localization:
             if self.selected_view.get() == "Detected Spots":
                 self.__flag_show_spots = True
             # refresh of displayed images process => evoked Thread
+            self.n_alpha_coefficients = 0  # used orders of polynomials are defined again by the 1st calculation
+            try:
+                self.localization_frames.get_nowait()  # remove the image left from the previous localization
+            except Empty:
+                pass
             self.reconstruction_updater = Thread(target=self.localize_spots_on_thread, args=())
             self.reconstruction_updater.start()  # start the Thread and assigned to it task
             self.get_focal_spots_button.config(text="Stop Localization", fg='red')
@@ -1561,15 +2143,15 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.__flag_show_spots = False
             if self.__flag_update_amplitudes:
                 self.__flag_update_amplitudes = False
-            time.sleep(70*self.gui_refresh_rate_ms/1000)  # required if the plotting currently running
+            self.plots_idle.wait(timeout=70*self.gui_refresh_rate_s)  # required if the plotting currently running
             # Below - removing drawn localized spots from the image
             if self.plot_points is not None:
                 self.plot_points.pop(0).remove(); self.plot_points = None
             # Cleaning the pcolormesh and colorbar from the image
             if self.frame_figure_colorbar is not None:
                 self.frame_figure_colorbar.remove(); self.frame_figure_colorbar = None
-            if self.frame_figure_pcolormesh is not None:
-                self.frame_figure_pcolormesh.remove(); self.frame_figure_pcolormesh = None
+            if self.frame_figure_zernikes_sum is not None:
+                self.frame_figure_zernikes_sum.remove(); self.frame_figure_zernikes_sum = None
             if self.show_coefficients_win is not None:
                 self.show_coefficients_win_close()  # close the bar plotting
             if self.selected_view.get() == "Coefficients":
@@ -1602,25 +2184,20 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         if view == "Coefficients":
             self.__flag_show_spots = False
             self.__flag_live_image_updater = False; self.imshowing = None
-            time.sleep(55*self.gui_refresh_rate_ms/1000)  # for stopping the live updater
+            self.plots_idle.wait(timeout=55*self.gui_refresh_rate_s)  # for finishing drawing of spots
             if self.plot_points is not None:
                 self.plot_points.pop(0).remove(); self.plot_points = None
-            time.sleep(self.gui_refresh_rate_ms/1000)
-            # See the setting up example in get_plot_zps_polar()
+            # Axes for showing the image of the unit circle with the sum of polynomials, see update_plots()
             if self.frame_figure_axes is not None:
                 self.frame_figure_axes.remove(); self.frame_figure_axes = None  # clear the axes
-            self.frame_figure_axes = self.frame_figure.add_subplot(projection='polar')
-            self.frame_figure_axes.grid(False); self.frame_figure_axes.axis('off')
-            self.frame_figure_axes.set_theta_direction(-1)
+            self.frame_figure_axes = self.frame_figure.add_subplot()
+            self.frame_figure_axes.axis('off')
             self.frame_figure.subplots_adjust(left=0, bottom=0, right=1, top=1)
-            self.frame_figure.tight_layout()
             self.__flag_update_amplitudes = True  # allowing to make amplitudes graph
             # Make the external window for the representation of the calculated coefficients
-            y_shift = (int(1.3*self.master.winfo_height())
-                       + int(self.master.winfo_geometry().split("+")[2]))  # vertical shift
-            x_shift = self.master.winfo_x()  # horizontal shift
-            height = self.master.winfo_height()
-            width = self.master.winfo_width() + self.additional_bar_width
+            width, height, x_shift, y = self.get_main_window_geometry()
+            y_shift = int(1.3*height) + y  # vertical shift
+            width += self.additional_bar_width
             self.show_coefficients_win = tk.Toplevel(master=self.camera_ctrl_window)
             self.show_coefficients_win.title("Zernike coefficients")
             self.show_coefficients_win.geometry(f'{width}x{height}+{x_shift}+{y_shift}')
@@ -1636,10 +2213,9 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         else:
             self.__flag_show_spots = True
             self.__flag_update_amplitudes = False
-            time.sleep(70*self.gui_refresh_rate_ms/1000)  # put some delay for prevent draw on refreshed image
+            self.plots_idle.wait(timeout=70*self.gui_refresh_rate_s)  # prevent draw on refreshed image
             if self.show_coefficients_win is not None:
                 self.show_coefficients_win_close()  # close the bar plotting
-            time.sleep(self.gui_refresh_rate_ms/1000)  # put some delay for cleaning
             self.restore_standard_figure()
             self.__flag_live_image_updater = True
 
@@ -1655,17 +2231,17 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         if self.frame_figure_axes is not None:
             self.frame_figure_axes.remove(); self.frame_figure_axes = None  # clear the axes
         self.frame_figure_axes = self.frame_figure.add_subplot()  # create new axis!
-        self.frame_figure_axes.axis('off'); self.frame_figure.tight_layout()
+        self.frame_figure_axes.axis('off')
         self.frame_figure.subplots_adjust(left=0, bottom=0, right=1, top=1)  # remove white borders
         self.imshowing = self.frame_figure_axes.imshow(self.current_image, cmap='plasma',
                                                        interpolation='none', vmin=0, vmax=255)
-        self.canvas.draw(); time.sleep(self.gui_refresh_rate_ms/1000)
+        self.canvas.draw(); time.sleep(self.gui_refresh_rate_s)
         self.plot_toolbar = NavigationToolbar2Tk(self.canvas, self.camera_ctrl_window, pack_toolbar=False)
         self.plot_toolbar.update()
 
     def localize_spots_on_thread(self):
         """
-        Localize current focal spots, calculate shifts between them and calibrated spots and Zernike coefficients.
+        Localize focal spots on each new live image, calculate their shifts from calibrated ones and Zernike coefficients.
 
         Returns
         -------
@@ -1673,33 +2249,50 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         while self.__flag_live_stream and self.__flag_live_localization:
-            t1 = time.perf_counter()
-            region_size = int(np.round(1.6*self.radius_value_lvRec.get(), 0))
-            self.coms_aberrated = get_coms_fast(image=self.current_image, nonaberrated_coms=self.coms_spots,
-                                                threshold_abs=self.threshold_value_lvRec.get(),
-                                                region_size=region_size)
+            # Wait for the new image, the timeout only for checking the flags above
+            try:
+                image = self.localization_frames.get(block=True, timeout=0.1)
+            except Empty:
+                continue
+            if self.print_timings:
+                t1 = time.perf_counter()
+            if (self.live_subregions_indices is None or self.live_subregions_key[0] is not self.coms_spots
+                    or self.live_subregions_key[1:] != (image.shape, self.live_region_size)):
+                self.live_subregions_indices = get_subregions_indices(self.coms_spots, image.shape, self.live_region_size)
+                self.live_subregions_key = (self.coms_spots, image.shape, self.live_region_size)
+                n_spots = np.size(self.coms_spots, 0)
+                self.live_coms_buffer = np.empty((n_spots, 2)); self.live_shifts_buffer = np.empty((n_spots, 2))
+            self.coms_aberrated = get_coms_fast(image=image, nonaberrated_coms=self.coms_spots,
+                                                threshold_abs=self.live_threshold,
+                                                region_size=self.live_region_size,
+                                                subregions_indices=self.live_subregions_indices,
+                                                out=self.live_coms_buffer)
             # Below - plotting found (localized focal spots)
             rows, cols = self.coms_aberrated.shape
             if rows > 0 and cols > 0:
-                (self.coms_shifts, self.integral_matrix_aberrated,
-                 self.coms_aberrated) = get_coms_shifts_fast(self.coms_spots, self.integral_matrix,
-                                                             self.coms_aberrated)
-                self.update_plots()  # Call for re-drawing plots wrapper function
+                shifts_results = get_coms_shifts_fast(self.coms_spots, self.integral_matrix, self.coms_aberrated,
+                                                      out=self.live_shifts_buffer)
+                coms_shifts, integral_matrix_aberrated = shifts_results[:2]  # used below by this thread only
+                (self.coms_shifts, self.integral_matrix_aberrated, self.coms_aberrated) = shifts_results
+                self.plots_idle.clear(); self.update_plots(); self.plots_idle.set()  # re-drawing plots wrapper function
                 rows, cols = self.coms_shifts.shape
                 if rows > 0 and cols > 0:
-                    self.alpha_coefficients = get_polynomials_coefficients(self.integral_matrix_aberrated,
-                                                                           self.coms_shifts)
+                    self.alpha_coefficients = self.get_alpha_coefficients(integral_matrix_aberrated, coms_shifts)
+                    self.zps_grid = None
                     if np.size(self.alpha_coefficients) > 0:
-                        self.alpha_coefficients = np.round(self.alpha_coefficients, 4)
+                        # Rounding in place, the array is newly returned by the calculation above
+                        np.round(self.alpha_coefficients, 4, out=self.alpha_coefficients)
                     # self.alpha_coefficients *= np.pi  # for adjusting to radians ???
-                    self.alpha_coefficients = list(self.alpha_coefficients)
-                    if len(self.alpha_coefficients) > 0:
-                        # Define below used orders of Zernikes and providing them for amplitudes calculation
-                        self.order = get_zernike_order_from_coefficients_number(len(self.alpha_coefficients))
-                        self.zernike_list_orders = get_zernike_coefficients_list(self.order)
+                    if np.size(self.alpha_coefficients) > 0:
+                        # Define below used orders of Zernikes only if the number of coefficients changed
+                        if np.size(self.alpha_coefficients) != self.n_alpha_coefficients:
+                            self.n_alpha_coefficients = np.size(self.alpha_coefficients)
+                            self.order = get_zernike_order_from_coefficients_number(self.n_alpha_coefficients)
+                            self.zernike_list_orders = get_zernike_coefficients_list(self.order)
                         # print(self.alpha_coefficients)  # for debugging
-                        self.update_plots()  # Call for re-drawing plots wrapper function
-                        t3 = time.perf_counter(); print("Coeff-s calc./showing takes sec.:", round((t3-t1), 1))
+                        self.plots_idle.clear(); self.update_plots(); self.plots_idle.set()
+                        if self.print_timings:
+                            t3 = time.perf_counter(); print("Coeff-s calc./showing takes sec.:", round((t3-t1), 1))
 
     def update_plots(self):
         """
@@ -1713,42 +2306,53 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         # Show the detected focal spots, if the live stream shown in the GUI
         if self.__flag_live_image_updater:
             if self.__flag_show_spots:
-                # Use only one sample of plt.lines.Line2D for drawing found spots
+                # Use only one sample of plt.lines.Line2D for drawing found spots. It's animated, i.e. not rendered
+                # into the cached background, and it's blitted by show_image() together with each live image
                 if self.plot_points is None:
                     self.plot_points = self.frame_figure_axes.plot(self.coms_aberrated[:, 1],
                                                                    self.coms_aberrated[:, 0],
-                                                                   '.', color="red")
+                                                                   '.', color="red", animated=True)
                 else:
                     self.plot_points[0].set_data(self.coms_aberrated[:, 1], self.coms_aberrated[:, 0])
-                self.canvas.draw_idle()  # redraw image in the widget (stored in canvas)
         elif not self.__flag_live_image_updater and self.__flag_update_amplitudes:
-            # below - function for drawing 2D Zernike polynomials coefficients sum
-            # Explicit call for making the pcolormesh plot
-            R, Theta, S = zernike_polynomials_sum_tuned(self.zernike_list_orders,
-                                                        self.alpha_coefficients,
-                                                        step_r=0.01, step_theta=1.0)
-            if self.frame_figure_pcolormesh is None:
-                self.frame_figure_pcolormesh = self.frame_figure_axes.pcolormesh(Theta, R, S,
-                                                                                 cmap='coolwarm',
-                                                                                 shading='nearest')
+            # below - drawing 2D Zernike polynomials coefficients sum
+            # Polynomials on the polar grid calculated once for the used orders, the sum - single matrix product
+            # Single precision is enough for showing the sum and it halves the memory used for its calculation
+            if self.zernike_basis is None or self.zernike_basis_orders != self.zernike_list_orders:
+                R, Theta, radial_part, angular_part = get_zernike_basis(self.zernike_list_orders, step_r=0.01,
+                                                                        step_theta=1.0)
+                self.zernike_basis = (R, Theta, radial_part.astype(np.float32), angular_part.astype(np.float32))
+                self.zernike_basis_orders = self.zernike_list_orders
+            R, Theta, radial_part, angular_part = self.zernike_basis
+            S = np.dot(radial_part*self.alpha_coefficients.astype(np.float32), angular_part)
+            # The sum is shown as the image of the unit circle, pixels take values of the nearest polar grid points
+            if self.zernikes_sum_image is None:
+                self.cartesian_indices, self.cartesian_mask = get_cartesian_grid_indices(step_r=0.01, step_theta=1.0)
+                self.zernikes_sum_image = np.full(self.cartesian_mask.shape, np.nan, dtype=np.float32)  # NaN - not shown
+            self.zernikes_sum_image[self.cartesian_mask] = S.ravel()[self.cartesian_indices]
+            if self.frame_figure_zernikes_sum is None:
+                self.frame_figure_zernikes_sum = self.frame_figure_axes.imshow(self.zernikes_sum_image, cmap='coolwarm',
+                                                                               interpolation='none')
                 # shows the colour bar on the figure
                 if self.frame_figure_colorbar is None:
-                    self.frame_figure_colorbar = self.frame_figure.colorbar(self.frame_figure_pcolormesh,
+                    self.frame_figure_colorbar = self.frame_figure.colorbar(self.frame_figure_zernikes_sum,
                                                                             ax=self.frame_figure_axes)
                 self.canvas.draw_idle()  # redraw the figure
+            elif self.frame_figure_zernikes_sum.axes is self.frame_figure_axes and self.frame_figure_colorbar is not None:
+                # Updating in place the image values, the color limits are set explicitly and the colorbar is updated
+                self.frame_figure_zernikes_sum.set_data(self.zernikes_sum_image)
+                self.frame_figure_zernikes_sum.set_clim(np.min(S), np.max(S))
+                self.frame_figure_colorbar.update_normal(self.frame_figure_zernikes_sum)
+                self.canvas.draw_idle()
             else:
-                # Updating the colormesh figure using the method of a QuadMesh class
-                # self.frame_figure_pcolormesh.set_array(S)
-                # Unfortunately, simple updating of array values doesn't provide the automatic
-                # update of colorbar. Therefore, below pcolormesh and colorbar deleted and re-created
+                # The axes changed, therefore, below image and colorbar deleted and re-created
                 if self.frame_figure_colorbar is not None:
                     self.frame_figure_colorbar.remove(); self.frame_figure_colorbar = None
-                if self.frame_figure_pcolormesh is not None:
-                    self.frame_figure_pcolormesh.remove(); self.frame_figure_pcolormesh = None
-                self.frame_figure_pcolormesh = self.frame_figure_axes.pcolormesh(Theta, R, S,
-                                                                                 cmap='coolwarm',
-                                                                                 shading='nearest')
-                self.frame_figure_colorbar = self.frame_figure.colorbar(self.frame_figure_pcolormesh,
+                if self.frame_figure_zernikes_sum is not None:
+                    self.frame_figure_zernikes_sum.remove(); self.frame_figure_zernikes_sum = None
+                self.frame_figure_zernikes_sum = self.frame_figure_axes.imshow(self.zernikes_sum_image, cmap='coolwarm',
+                                                                               interpolation='none')
+                self.frame_figure_colorbar = self.frame_figure.colorbar(self.frame_figure_zernikes_sum,
                                                                         ax=self.frame_figure_axes)
 
                 self.canvas.draw_idle()
@@ -1758,23 +2362,21 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
                     self.make_amplitudes_subplots()  # see the wrapper function
                 else:
                     if self.amplitudes_showing is not None:
-                        # Bars updating using the method of a BarContainer class
-                        # Unfortunately, the command below doesn't send automatic command
-                        # to update the axes parameters
-                        # bar.set_height(self.alpha_coefficients[i]); i += 1
-                        # Because of the reason above, the dirty hack now is to remove /
-                        # recreate bar plots
-                        self.amplitudes_showing.remove(); self.amplitudes_showing = None
-                        if self.amplitudes_figure_axes is not None and self.__flag_bar_plot:
-                            self.amplitudes_showing = self.amplitudes_figure_axes.bar(self.names,
-                                                                                      self.alpha_coefficients,
-                                                                                      color='blue')
-                            # Dynamically update the limits on Y axis
-                            min_tick = min(self.alpha_coefficients) - abs(0.2*min(self.alpha_coefficients))
-                            max_tick = max(self.alpha_coefficients) + abs(0.1*max(self.alpha_coefficients))
-                            # below - manually set the limit on Y axis on the Axes class
-                            if self.amplitudes_figure_axes is not None:
-                                self.amplitudes_figure_axes.set_ylim(bottom=min_tick, top=max_tick)
+                        if len(self.amplitudes_showing.patches) == np.size(self.alpha_coefficients):
+                            # Bars updating in place using the patches of a BarContainer class
+                            for bar, amplitude in zip(self.amplitudes_showing.patches, self.alpha_coefficients):
+                                bar.set_height(amplitude)
+                        else:
+                            # The orders of polynomials changed - bars and their names re-created
+                            self.amplitudes_showing.remove(); self.amplitudes_showing = None
+                            self.amplitudes_figure_axes.cla(); self.make_amplitudes_subplots()
+                        # Setting heights doesn't update the axes limits, so the limits on Y axis updated below
+                        min_amplitude = np.min(self.alpha_coefficients); max_amplitude = np.max(self.alpha_coefficients)
+                        min_tick = min_amplitude - abs(0.2*min_amplitude)
+                        max_tick = max_amplitude + abs(0.1*max_amplitude)
+                        # below - manually set the limit on Y axis on the Axes class
+                        if self.amplitudes_figure_axes is not None:
+                            self.amplitudes_figure_axes.set_ylim(bottom=min_tick, top=max_tick)
                 if self.amplitudes_canvas is not None and self.__flag_bar_plot:
                     self.amplitudes_canvas.draw_idle()
 
@@ -1798,7 +2400,6 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
             self.amplitudes_showing = self.amplitudes_figure_axes.bar(self.names,
                                                                       self.alpha_coefficients,
                                                                       color='blue')
-            self.amplitudes_figure.tight_layout()
 
     def show_coefficients_win_close(self):
         """
@@ -1810,9 +2411,10 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
 
         """
         self.__flag_bar_plot = False
-        time.sleep(75*self.gui_refresh_rate_ms/1000)  # for ensuring that the drawing of bars stopped
+        self.plots_idle.wait(timeout=75*self.gui_refresh_rate_s)  # for ensuring that the drawing of bars stopped
         if self.amplitudes_figure_axes is not None:
             self.amplitudes_figure_axes.remove(); self.amplitudes_figure_axes = None
+        self.amplitudes_showing = None  # bars are drawn again on the new axes then the window opened again
         self.amplitudes_figure = None; self.amplitudes_canvas = None
         self.show_coefficients_win.destroy(); self.show_coefficients_win = None
 
@@ -1827,18 +2429,21 @@ class ReconstructionUI(tk.Frame):  # The way of making the ui as the child of Fr
         """
         if self.__flag_bar_plot:
             self.show_coefficients_win_close()
-        self.close_current_camera(); time.sleep(2*self.gui_refresh_rate_ms/1000)
+        self.close_current_camera(); time.sleep(2*self.gui_refresh_rate_s)
         if self.exceptions_checker.is_alive():
             self.exceptions_queue.put_nowait("Stop Exception Checker")
             # The problem is here, that Thread below somehow waits for exit action, so
             # this Thread cannot be joined in the main thread, therefore
             # self.exceptions_checker.join() deleted from here
-            time.sleep(2*self.gui_refresh_rate_ms/1000)  # additional delay
+            time.sleep(2*self.gui_refresh_rate_s)  # additional delay
         if self.messages_printer.is_alive():
             self.camera_messages.put_nowait("Stop Messages Printer")
-            time.sleep(2*self.gui_refresh_rate_ms/1000)  # additional delay
+            time.sleep(2*self.gui_refresh_rate_s)  # additional delay
             self.messages_printer.join()
             print("Messages Printer stopped")
+        if self.pending_exposure_t_setting is not None:
+            self.camera_ctrl_window.after_cancel(self.pending_exposure_t_setting)
+        self.frames_ring.close(unlink=True)  # free the shared memory used for passing images
         self.camera_ctrl_window.destroy(); self.camera_ctrl_window = None
 
 
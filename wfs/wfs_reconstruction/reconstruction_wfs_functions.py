@@ -15,25 +15,20 @@ Reference
 
 # %% Imports - global dependencies (from standard library and installed by conda / pip)
 import numpy as np
-from skimage.feature import peak_local_max
 # import time
 from matplotlib.patches import Circle
 # from matplotlib.patches import Rectangle  # uncomment in need of visualization of selected area for CoM calculation
-from scipy import ndimage
-from threading import Thread
-from queue import Empty, Queue
+from threading import Thread, Event
+from queue import Queue
 from pathlib import Path
+from functools import lru_cache
 
 # %% Imports - local dependencies (modules / packages in the containing it folder / sub-folders)
 if __name__ == "__main__" or __name__ == Path(__file__).stem:
     # Actual call as the standalone module or from other module from this package (as a dependency)
-    from zernike_pol_calc import normalization_factor
-    from calc_zernikes_sh_wfs import (rho_ab, rho_integral_funcX, rho_integral_funcY, check_img_coordinate,
-                                      r_integral_tabular_funcX, r_integral_tabular_funcY)
+    from zernike_pol_calc import normalization_factor, vectorized_radial_polynomial_derivative
 else:  # relative imports for resolving these dependencies in the case of import as module from a package
-    from .zernike_pol_calc import normalization_factor
-    from .calc_zernikes_sh_wfs import (rho_ab, rho_integral_funcX, rho_integral_funcY, check_img_coordinate,
-                                       r_integral_tabular_funcX, r_integral_tabular_funcY)
+    from .zernike_pol_calc import normalization_factor, vectorized_radial_polynomial_derivative
 
 
 # %% Function definitions
@@ -61,29 +56,96 @@ def get_localCoM_matrix(image: np.ndarray, axes_fig, min_dist_peaks: int = 15, t
         Calculated center of masses (CoMs) coordinates.
 
     """
+    from skimage.feature import peak_local_max
     detected_centers = peak_local_max(image, min_distance=min_dist_peaks, threshold_abs=threshold_abs)
     (rows, cols) = image.shape
     # axes_fig.plot(detected_centers[:, 1], detected_centers[:, 0], '.', color="red")  # plot local peaks
     half_size = region_size // 2  # Half of rectangle area for calculation of CoM
     size = np.size(detected_centers, 0)  # Number of found local peaks
     coms = np.zeros((size, 2), dtype='float')  # Center of masses coordinates initialization
-    for i in range(size):
-        x_left_upper = check_img_coordinate(cols, detected_centers[i, 1] - half_size)
-        y_left_upper = check_img_coordinate(rows, detected_centers[i, 0] - half_size)
-        # Plot found regions for CoM calculations
-        # axes_fig.add_patch(Rectangle((x_left_upper, y_left_upper), 2*half_size, 2*half_size,
-        #                              linewidth=1, edgecolor='yellow', facecolor='none'))
-        # CoMs calculation
-        subregion = image[y_left_upper:y_left_upper+2*half_size, x_left_upper:x_left_upper+2*half_size]
-        (coms[i, 0], coms[i, 1]) = ndimage.center_of_mass(subregion)
-        coms[i, 0] += y_left_upper; coms[i, 1] += x_left_upper
+    if size == 0:
+        return coms
+    # Left upper corners of the regions (clipped to the image borders) and indices of their pixels
+    (y_left_upper, x_left_upper, indices, inside) = get_subregions_indices(detected_centers, (rows, cols), region_size)
+    # Plot found regions for CoM calculations
+    # for i in range(size):
+    #     axes_fig.add_patch(Rectangle((x_left_upper[i], y_left_upper[i]), 2*half_size, 2*half_size,
+    #                                  linewidth=1, edgecolor='yellow', facecolor='none'))
+    # Gather all subregions into the single array, pixels of the regions cropped by the image borders are zero
+    subregions = np.take(image.ravel(), indices); subregions *= inside
+    (y_coms, x_coms) = get_subregions_coms(subregions, 2*half_size)
+    coms[:, 0] = y_coms + y_left_upper; coms[:, 1] = x_coms + x_left_upper
     # Plot found CoMs
     # axes_fig.plot(coms[:, 1], coms[:, 0], '.', color="green")
     return coms
 
 
-def get_coms_fast(image: np.ndarray, nonaberrated_coms: np.ndarray,
-                  threshold_abs: float = 55.0, region_size: int = 16) -> np.array:
+def get_subregions_indices(nonaberrated_coms: np.ndarray, image_shape: tuple, region_size: int = 16) -> tuple:
+    """
+    Calculate indices of pixels of the flattened image composing the local regions around of found previously focal spots.
+
+    The regions depend only on the calibrated focal spots, image shape and region size, so they can be calculated once and
+    reused by get_coms_fast() for all images with the same shape.
+
+    Parameters
+    ----------
+    nonaberrated_coms: np.ndarray
+        Loaded or localized in the program focal spots of the plane wavefront.
+    image_shape : tuple
+        Shape of the image as (rows, cols).
+    region_size : int, optional
+        Size of local rectangle, there the center of mass is calculated. The default is 16.
+
+    Returns
+    -------
+    tuple
+        As (y_left_upper, x_left_upper, indices, inside) - left upper corners of the regions, indices of the flattened image
+        with the shape (Number of spots, region pixels) and the mask of pixels lying inside the image (the rest are zero pixels).
+
+    """
+    (rows, cols) = image_shape[:2]
+    half_size = region_size // 2  # Half of rectangle area for calculation of CoM
+    nonaberrated_coms = (np.round(nonaberrated_coms, 0)).astype(int)
+    # Left upper corners of the regions, clipped to the image borders as check_img_coordinate() does
+    y_left_upper = np.clip(nonaberrated_coms[:, 0] - half_size, 0, rows)
+    x_left_upper = np.clip(nonaberrated_coms[:, 1] - half_size, 0, cols)
+    offsets = np.arange(2*half_size)
+    y_pixels = y_left_upper[:, np.newaxis] + offsets; x_pixels = x_left_upper[:, np.newaxis] + offsets
+    # Regions are cropped at the bottom / right borders, cropped pixels are replaced by zero ones
+    inside = (y_pixels < rows)[:, :, np.newaxis] & (x_pixels < cols)[:, np.newaxis, :]
+    indices = y_pixels[:, :, np.newaxis]*cols + x_pixels[:, np.newaxis, :]
+    indices[~inside] = 0; n_spots = np.size(nonaberrated_coms, 0)
+    return y_left_upper, x_left_upper, indices.reshape(n_spots, -1), inside.reshape(n_spots, -1)
+
+
+def get_subregions_coms(subregions: np.ndarray, region_side: int) -> tuple:
+    """
+    Calculate center of masses of the square subregions gathered as the rows of the single array.
+
+    The pixel coordinates grid (offsets inside a subregion) is created once for all subregions and applied to the sums of
+    their rows and columns, instead of making the coordinates grid for each subregion (as ndimage.center_of_mass() does).
+
+    Parameters
+    ----------
+    subregions : np.ndarray
+        Pixels of subregions with the shape (Number of subregions, region_side*region_side).
+    region_side : int
+        Side (in pixels) of a square subregion.
+
+    Returns
+    -------
+    tuple
+        As (y_coms, x_coms) - coordinates of CoMs relatively to the left upper corners of subregions.
+
+    """
+    subregions = subregions.reshape(-1, region_side, region_side).astype(float)
+    offsets = np.arange(region_side, dtype=float); totals = np.sum(subregions, axis=(1, 2))
+    y_coms = np.dot(np.sum(subregions, axis=2), offsets)/totals; x_coms = np.dot(np.sum(subregions, axis=1), offsets)/totals
+    return y_coms, x_coms
+
+
+def get_coms_fast(image: np.ndarray, nonaberrated_coms: np.ndarray, threshold_abs: float = 55.0, region_size: int = 16,
+                  subregions_indices: tuple = None, out: np.ndarray = None) -> np.array:
     """
     Calculate local center of masses in the region around of found previously peaks (thus it's faster than get_localCoM_matrix()).
 
@@ -97,6 +159,10 @@ def get_coms_fast(image: np.ndarray, nonaberrated_coms: np.ndarray,
         Absolute minimal intensity value for start searching of a local peak. The default is 55.0.
     region_size : int, optional
         Size of local rectangle, there the center of mass is calculated. The default is 16.
+    subregions_indices : tuple, optional
+        Precalculated by get_subregions_indices() for the same spots, image shape and region size. The default is None.
+    out : np.ndarray, optional
+        Preallocated array with the shape (Number of spots, 2) for storing the CoMs (reused for each frame). The default is None.
 
     Returns
     -------
@@ -104,27 +170,27 @@ def get_coms_fast(image: np.ndarray, nonaberrated_coms: np.ndarray,
         Calculated center of masses (CoMs) coordinates.
 
     """
-    (rows, cols) = image.shape
-    half_size = region_size // 2  # Half of rectangle area for calculation of CoM
     size = np.size(nonaberrated_coms, 0)  # Number of found local peaks
-    nonaberrated_coms = (np.round(nonaberrated_coms, 0)).astype(int)
-    coms = np.zeros((size, 2), dtype='float')  # Center of masses coordinates initialization
-    for i in range(size):
-        x_left_upper = check_img_coordinate(cols, nonaberrated_coms[i, 1] - half_size)
-        y_left_upper = check_img_coordinate(rows, nonaberrated_coms[i, 0] - half_size)
-        # CoMs calculation
-        subregion = image[y_left_upper:y_left_upper+2*half_size, x_left_upper:x_left_upper+2*half_size]
-        if np.max(subregion) >= threshold_abs:
-            (coms[i, 0], coms[i, 1]) = ndimage.center_of_mass(subregion)
-            coms[i, 0] += y_left_upper; coms[i, 1] += x_left_upper
-            x_center = int(round(coms[i, 1], 0)); y_center = int(round(coms[i, 0], 0))
-            peak_value = image[y_center, x_center]
-            # Check that found CoM correspond to the bright spot
-            if peak_value < threshold_abs:
-                coms[i, 0] = -1; coms[i, 1] = -1
-        else:
-            coms[i, 0] = -1; coms[i, 1] = -1
-
+    if out is not None and out.shape == (size, 2):
+        coms = out; coms.fill(-1.0)
+    else:
+        coms = np.full((size, 2), -1.0)  # Center of masses coordinates initialization, -1 - not detected spot
+    if size == 0:
+        return coms
+    if subregions_indices is None:
+        subregions_indices = get_subregions_indices(nonaberrated_coms, image.shape, region_size)
+    (y_left_upper, x_left_upper, indices, inside) = subregions_indices
+    # Gather all subregions into the single array (Number of spots, region pixels)
+    subregions = np.take(image.ravel(), indices); subregions *= inside
+    # CoMs calculated only for subregions containing bright enough pixels
+    bright = np.flatnonzero(np.max(subregions, axis=1) >= threshold_abs)
+    if np.size(bright) == 0:
+        return coms
+    (y_coms, x_coms) = get_subregions_coms(subregions[bright], 2*(region_size // 2))
+    y_coms += y_left_upper[bright]; x_coms += x_left_upper[bright]
+    # Check that found CoMs correspond to the bright spots
+    spots = image[np.round(y_coms).astype(int), np.round(x_coms).astype(int)] >= threshold_abs
+    coms[bright[spots], 0] = y_coms[spots]; coms[bright[spots], 1] = x_coms[spots]
     return coms
 
 
@@ -217,9 +283,12 @@ def get_integral_limits_nonaberrated_centers(axes_fig, picture_as_array: np.ndar
     return subapertures_wt_central, theta0, rho0, integration_limits
 
 
-def get_zernike_coefficients_list(selected_order: int) -> list:
+@lru_cache(maxsize=64)
+def get_zernike_coefficients_list(selected_order: int) -> tuple:
     """
-    Return list with tuples containing azimuthal and radial orders (m, n).
+    Return tuple with tuples containing azimuthal and radial orders (m, n).
+
+    The result is cached, so it's returned as the immutable tuple.
 
     Parameters
     ----------
@@ -228,8 +297,8 @@ def get_zernike_coefficients_list(selected_order: int) -> list:
 
     Returns
     -------
-    list
-        List with sequential azimuthal and radial orders stored in tuples as (m, n).
+    tuple
+        Tuple with sequential azimuthal and radial orders stored in tuples as (m, n).
 
     """
     zernike_coefficients_dict = {1: [(-1, 1), (1, 1)], 2: [(-1, 1), (1, 1), (-2, 2), (0, 2), (2, 2)],
@@ -240,11 +309,12 @@ def get_zernike_coefficients_list(selected_order: int) -> list:
                                      (-4, 4), (-2, 4), (0, 4), (2, 4), (4, 4), (-5, 5), (-3, 5), (-1, 5), (1, 5),
                                      (3, 5), (5, 5)]}
     if 1 <= selected_order <= 5:
-        return zernike_coefficients_dict[selected_order]
+        return tuple(zernike_coefficients_dict[selected_order])
     else:
-        return []
+        return ()
 
 
+@lru_cache(maxsize=64)
 def get_zernike_order_from_coefficients_number(coefficients_number: int) -> int:
     """
     Return maximum Zernike polynomial order.
@@ -267,12 +337,16 @@ def get_zernike_order_from_coefficients_number(coefficients_number: int) -> int:
         return -1
 
 
-def calc_integrals_on_apertures_unit_circle(integration_limits: np.ndarray, theta0: np.ndarray, rho0: np.ndarray, m: int, n: int,
-                                            messages_queue: Queue, n_polynomial: int = 1, aperture_radius: float = 15.0,
-                                            n_steps: int = 50, swapXY: bool = True) -> np.ndarray:
+def calc_integrals_on_apertures_unit_circle(integration_limits: np.ndarray, theta0: np.ndarray, rho0: np.ndarray, orders: list,
+                                            abort_event: Event, aperture_radius: float = 15.0, n_steps: int = 50,
+                                            swapXY: bool = True) -> np.ndarray:
     """
     Calculate integrals using trapezoidal rule inside the sub-apertures, which lies inside the unit circle.
 
+    The integrands are evaluated at once for all polynomials on the (rho, theta) grids of all sub-apertures: radial polynomials
+    and their derivatives by Horner's scheme on rho^2 (shared by the polynomials with the same |m| and n), triangular functions
+    as real / imaginary parts of z^|m|, there z = cos(theta) + 1j*sin(theta) (powers calculated iteratively once for all |m|).
+
     Parameters
     ----------
     integration_limits : np.ndarray
@@ -281,14 +355,10 @@ def calc_integrals_on_apertures_unit_circle(integration_limits: np.ndarray, thet
         Polar coordinate theta of sub-aperture centers.
     rho0 : np.ndarray
         Polar coordinates r of sub-aperture centers.
-    m : int
-        Azimuthal order of the Zernike polynomial.
-    n : int
-        Radial order of the Zernike polynomial.
-    messages_queue : Queue
-        Pipe for checking of Stop event and sending back the messages about the calculation progress.
-    n_polynomial : int, optional
-        Number of polynomial for which the integration calculated. The default is 1.
+    orders : list
+        All polynomial specification as 2 orders (m, n) in list.
+    abort_event : Event
+        Flag set by the GUI for stopping the calculation.
     aperture_radius : float, optional
         Radius of sub-aperture in pixels on the image. The default is 15.0.
     n_steps : int, optional
@@ -299,92 +369,81 @@ def calc_integrals_on_apertures_unit_circle(integration_limits: np.ndarray, thet
 
     Returns
     -------
-    integral_values : ndarray with sizes (Number of sub-apertures, 2)
-        Resulting integration values for each sub-aperture, they are listed for Y and X axes (relatively to image coordinate system).
+    integral_values : ndarray with sizes (Number of sub-apertures, 2*Number of polynomials)
+        Resulting integration values for each sub-aperture, they are listed for Y and X axes (relatively to image coordinate system)
+        for each polynomial.
 
     """
-    integral_values = np.zeros((len(integration_limits), 2), dtype='float')  # Doubled values - for X,Y axes
+    n_modes = len(orders); integral_values = np.zeros((len(integration_limits), 2*n_modes), dtype='float')  # X,Y axes
+    # The abort is checked only between the vectorized blocks below (before the start and after the polynomials calculated),
+    # the calculation for all sub-apertures and modes takes milliseconds, so "Abort" isn't delayed noticeably
+    if abort_event.is_set() or len(integration_limits) == 0 or n_modes == 0:
+        return integral_values
     # calibration = 1.0  # TODO: Calibration taking into account the wavelength, focal length should be implemented later
     # Introduction of Zernike's polynomials normalization coefficients => tune of each polynomial contribution
-    calibration = normalization_factor(m, n)  # use it for recalculate integral values for testing
+    calibration = np.asarray([normalization_factor(m, n) for (m, n) in orders])[:, np.newaxis]
     rho_unit_calibration = np.max(rho0) + aperture_radius  # For making integration on rho on unit circle
-    # For each sub-aperture below integration on (r, theta) of the Zernike polynomials
-    calculation_flag = True  # for stopping the calculation if appropriate messages received
-    for i_subaperture in range(len(integration_limits)):
-        if not messages_queue.empty():
-            try:
-                message = messages_queue.get_nowait()
-                if message == "Stop integration":
-                    calculation_flag = False
-                    messages_queue.put_nowait(message)
-            except Empty:
-                pass
-        if calculation_flag:
-            # print(f"Integration for #{n_polynomial} pol. started on {i_subaperture} subaperture out of {len(integration_limits)}")
-            # Integration limits and steps on theta
-            (theta_a, theta_b) = integration_limits[i_subaperture]  # Calculated previously integration steps on theta (radians)
-            delta_theta = (theta_b - theta_a)/n_steps  # Step for integration on theta
-            theta = theta_a  # initial value of theta
-            # Getting limits for integration on rho
-            (rho_a, rho_b) = rho_ab(rho0[i_subaperture], theta, theta0[i_subaperture], aperture_radius)
-            # All rho values should be normalized to the maximum rho0 coordinate + radius_subaperture
-            rho_a /= rho_unit_calibration; rho_b /= rho_unit_calibration
-            # Integration over theta (trapezoidal rule)
-            integral_sumX = 0.0; integral_sumY = 0.0
-            for j_theta in range(n_steps+1):
-                # Integration on rho for X and Y axis (trapezoidal formula)
-                rho = rho_a  # Lower integration boundary
-                delta_rho = (rho_b - rho_a)/n_steps
-                integral_sum_rhoX1 = 0.0; integral_sum_rhoX2 = 0.0; integral_sum_rhoY1 = 0.0; integral_sum_rhoY2 = 0.0
-                for j_rho in range(n_steps+1):
-                    # get 2 parts of functions according the thesis
-                    if n <= 7:  # tabular functions specified up to this order
-                        (X1, X2) = r_integral_tabular_funcX(rho, theta, m, n)
-                        (Y1, Y2) = r_integral_tabular_funcY(rho, theta, m, n)
-                    else:
-                        (X1, X2) = rho_integral_funcX(rho, theta, m, n)
-                        (Y1, Y2) = rho_integral_funcY(rho, theta, m, n)
-                    # multiplication depends on starting / finishing point according to the formula
-                    if (j_rho == 0) or (j_rho == n_steps):
-                        integral_sum_rhoX1 += 0.5*X1; integral_sum_rhoX2 += 0.5*X2  # on X axis
-                        integral_sum_rhoY1 += 0.5*Y1; integral_sum_rhoY2 += 0.5*Y2  # on Y axis
-                    else:
-                        integral_sum_rhoX1 += X1; integral_sum_rhoX2 += X2
-                        integral_sum_rhoY1 += Y1; integral_sum_rhoY2 += Y2
-                    rho += delta_rho
-                integral_sum_rhoX = (integral_sum_rhoX1 - integral_sum_rhoX2)  # Equations from thesis
-                integral_sum_rhoY = (integral_sum_rhoY1 + integral_sum_rhoY2)  # Equations from thesis
-                # End of integration on rho (i.e. r from polar coordinates)
-                integral_sum_rhoX *= delta_rho; integral_sum_rhoY *= delta_rho
-                if (j_theta == 0) and (j_theta == n_steps):
-                    integral_sumX += 0.5*integral_sum_rhoX; integral_sumY += 0.5*integral_sum_rhoY
-                else:
-                    integral_sumX += integral_sum_rhoX; integral_sumY += integral_sum_rhoY
-                theta += delta_theta
-            integral_sumX *= delta_theta; integral_sumY *= delta_theta  # End of integration on theta
-            # actually, the integral values should be calibrated to each sub-aperture area - depending on the integration limits
-            integral_sumX /= 0.5*(theta_b - theta_a)*((rho_b*rho_b)-(rho_a*rho_a))  # 0.5 - due to integration from (rdr)dtheta
-            integral_sumY /= 0.5*(theta_b - theta_a)*((rho_b*rho_b)-(rho_a*rho_a))
-            # The final integral values should be also calibrated to focal and wavelengths, but it's not yet implemented
-            if swapXY:  # Choosing the relation between X and Y axis calculation (swap them on demand)
-                integral_values[i_subaperture, 1] = calibration*integral_sumX  # Not yet implemented calibration, not necessary now
-                integral_values[i_subaperture, 0] = calibration*integral_sumY
-            else:
-                integral_values[i_subaperture, 0] = calibration*integral_sumX
-                integral_values[i_subaperture, 1] = calibration*integral_sumY
-            integral_values = np.round(integral_values, 8)  # rounding up to ... digits after coma
+    # Integration limits and steps on theta for all sub-apertures
+    integration_limits = np.asarray(integration_limits, dtype='float'); steps = np.arange(n_steps+1)
+    theta_a = integration_limits[:, 0]; theta_b = integration_limits[:, 1]
+    delta_theta = (theta_b - theta_a)/n_steps  # Steps for integration on theta
+    theta = theta_a[:, np.newaxis] + delta_theta[:, np.newaxis]*steps
+    # Limits for integration on rho (the same as returned by rho_ab() for the starting theta), normalized to the unit circle
+    cosin = np.cos(theta_a - theta0); rho0sq = rho0*rho0
+    # abs() - the same workaround as in rho_ab() for the negative values under sqrt for big polar coordinates
+    root = np.sqrt(np.abs(rho0sq*(cosin*cosin - 1.0) + aperture_radius*aperture_radius))
+    rho_a = (rho0*cosin - root)/rho_unit_calibration; rho_b = (rho0*cosin + root)/rho_unit_calibration
+    delta_rho = (rho_b - rho_a)/n_steps
+    rho = rho_a[:, np.newaxis] + delta_rho[:, np.newaxis]*steps
+    # Radial polynomials and triangular functions (with derivatives) for all polynomials, stacked along the first axis
+    radial_parts = {}; z = np.cos(theta) + 1j*np.sin(theta); cos_theta = z.real; sin_theta = z.imag
+    z_powers = [np.ones(theta.shape, dtype='complex')]  # z^0, z^1, ... z^max(|m|)
+    for _ in range(max(abs(m) for (m, n) in orders)):
+        z_powers.append(z_powers[-1]*z)
+    Rmn = np.empty((n_modes,) + rho.shape); derivRmn = np.empty((n_modes,) + rho.shape)
+    angular = np.empty((n_modes,) + theta.shape); deriv_angular = np.empty((n_modes,) + theta.shape)
+    for i, (m, n) in enumerate(orders):
+        if (abs(m), n) not in radial_parts.keys():
+            radial_parts[(abs(m), n)] = vectorized_radial_polynomial_derivative(m, n, rho)
+        (Rmn[i], derivRmn[i]) = radial_parts[(abs(m), n)]
+        z_m = z_powers[abs(m)]  # cos(|m|*theta) + 1j*sin(|m|*theta)
+        if m > 0:
+            angular[i] = z_m.real; deriv_angular[i] = -m*z_m.imag
+        elif m < 0:
+            angular[i] = z_m.imag; deriv_angular[i] = -m*z_m.real
         else:
-            break  # stop the integration on each sub-aperture
+            angular[i] = 1.0; deriv_angular[i] = 0.0
+    if abort_event.is_set():
+        return integral_values
+    # Integration on rho for X and Y axis (trapezoidal formula), integrands are separable on (rho, theta)
+    rho_weights = np.ones(n_steps+1); rho_weights[0] = 0.5; rho_weights[-1] = 0.5
+    integral_rho1 = delta_rho*np.dot(derivRmn*rho, rho_weights); integral_rho2 = delta_rho*np.dot(Rmn, rho_weights)
+    # Integration over theta, all points summed with the unit weights (the ends of the sum on theta are not halved)
+    integral_sumX = delta_theta*(integral_rho1*np.einsum('kij,ij->ki', angular, cos_theta)
+                                 - integral_rho2*np.einsum('kij,ij->ki', deriv_angular, sin_theta))  # Equations from thesis
+    integral_sumY = delta_theta*(integral_rho1*np.einsum('kij,ij->ki', angular, sin_theta)
+                                 + integral_rho2*np.einsum('kij,ij->ki', deriv_angular, cos_theta))  # Equations from thesis
+    # actually, the integral values should be calibrated to each sub-aperture area - depending on the integration limits
+    subaperture_areas = 0.5*(theta_b - theta_a)*((rho_b*rho_b)-(rho_a*rho_a))  # 0.5 - due to integration from (rdr)dtheta
+    integral_sumX /= subaperture_areas; integral_sumY /= subaperture_areas
+    # The final integral values should be also calibrated to focal and wavelengths, but it's not yet implemented
+    if swapXY:  # Choosing the relation between X and Y axis calculation (swap them on demand)
+        integral_values[:, 1::2] = (calibration*integral_sumX).T  # Not yet implemented calibration, not necessary now
+        integral_values[:, 0::2] = (calibration*integral_sumY).T
+    else:
+        integral_values[:, 0::2] = (calibration*integral_sumX).T
+        integral_values[:, 1::2] = (calibration*integral_sumY).T
+    integral_values = np.round(integral_values, 8)  # rounding up to ... digits after coma
     return integral_values
 
 
 def calc_integral_matrix_zernike(progress_bar, zernike_polynomials_list: list, integration_limits: np.ndarray, theta0: np.ndarray,
-                                 rho0: np.ndarray, messages_queue: Queue, aperture_radius: float = 15.0,
+                                 rho0: np.ndarray, messages_queue: Queue, abort_event: Event, aperture_radius: float = 15.0,
                                  n_steps: int = 10, swapXY: bool = True) -> np.ndarray:
     """
     Wrap calculation of integral values on sub-apertures performing on several Zernike polynomials.
 
-    For shortening time of calculation, use the increasing order of listing of polynomials coefficients (like [(-1, 1), (1, 1)])
+    Integrals for all polynomials are calculated by the single call of calc_integrals_on_apertures_unit_circle().
 
     Parameters
     ----------
@@ -399,7 +458,9 @@ def calc_integral_matrix_zernike(progress_bar, zernike_polynomials_list: list, i
     rho0 : np.ndarray
         Polar coordinates r of sub-aperture centers.
     messages_queue : Queue
-        Pipe for checking of Stop event and sending back the messages about the calculation progress.
+        Pipe for sending back the messages about the calculation progress.
+    abort_event : Event
+        Flag set by the GUI for stopping the calculation.
     aperture_radius : float, optional
         Radius of sub-aperture in pixels on the image. The default is 15.0.
     n_steps : int, optional
@@ -414,63 +475,17 @@ def calc_integral_matrix_zernike(progress_bar, zernike_polynomials_list: list, i
         Resulting integration values for each sub-aperture and for both X and Y axes and specified Zernike values.
 
     """
-    progress_bar['value'] = 0  # refresh progress bar
-    n_rows = np.size(rho0, 0)
-    n_cols = 2*len(zernike_polynomials_list)  # Because calculation needed for both X and Y axes
-    integral_matrix = np.zeros((n_rows, n_cols), dtype='float')
-    # Shortening the time of calculation because of symmetrical integrals over sub-apertures for (-1, 1) and (1, 1),
-    # (-2, 2) and (2, 2), (-3, 3) and (-4, 4) - applying below reassignment
-    symmetrical_substitution = False; i_symmetry = -1
-    calculation_flag = True  # flag for stopping calculation
-    length_add = (100 // len(zernike_polynomials_list))  # portion for progress bar
-    s = 0  # for calculation of increasing progress bar value
     progress_bar['value'] = 5  # some visually initial progress bar value
-    # Integration for each polynomial:
-    for i in range(len(zernike_polynomials_list)):
-        # Check the messages for stopping integration
-        if not messages_queue.empty():
-            try:
-                message = messages_queue.get_nowait()
-                if message == "Stop integration":
-                    calculation_flag = False
-            except Empty:
-                pass
-        if calculation_flag:
-            (m, n) = zernike_polynomials_list[i]
-            if (((m == -1) and (n == 1)) or ((m == -2) and (n == 2)) or ((m == -3) and (n == 3)) or ((m == -4) and (n == 4))
-                    or ((m == -5) and (n == 5))):
-                i_symmetry = i; symmetrical_substitution = True  # Regulates if shortening of calculation happen below
-            if symmetrical_substitution:
-                if (((m == 1) and (n == 1)) or ((m == 2) and (n == 2)) or ((m == 3) and (n == 3)) or ((m == 4) and (n == 4))
-                        or ((m == 5) and (n == 5))):
-                    # Shortening the time of calculation because of symmetrical integrals over sub-apertures for (-1, 1) and (1, 1),
-                    # (-2, 2) and (2, 2), (-3, 3) and (-4, 4) - applying below reassignment
-                    integral_matrix[:, 2*i] = -integral_matrix[:, 2*i_symmetry+1]
-                    integral_matrix[:, 2*i+1] = integral_matrix[:, 2*i_symmetry]
-                else:
-                    # Normal integrals calculation
-                    integral_values = calc_integrals_on_apertures_unit_circle(integration_limits, theta0, rho0, m, n,
-                                                                              messages_queue=messages_queue, n_polynomial=i+1,
-                                                                              aperture_radius=aperture_radius, n_steps=n_steps,
-                                                                              swapXY=swapXY)
-                    integral_matrix[:, 2*i] = integral_values[:, 0]; integral_matrix[:, 2*i+1] = integral_values[:, 1]
-            else:
-                # Normal integrals calculation
-                integral_values = calc_integrals_on_apertures_unit_circle(integration_limits, theta0, rho0, m, n,
-                                                                          messages_queue=messages_queue, n_polynomial=i+1,
-                                                                          aperture_radius=aperture_radius, n_steps=n_steps,
-                                                                          swapXY=swapXY)
-                integral_matrix[:, 2*i] = integral_values[:, 0]; integral_matrix[:, 2*i+1] = integral_values[:, 1]
-            print(f"Calculated {i+1} polynomial out of {len(zernike_polynomials_list)}")
-            s += length_add; progress_bar['value'] = s
-        else:
-            # Integration was aborted
-            progress_bar['value'] = 0; integral_matrix = []; break  # stop for loop above
-    if calculation_flag:
-        messages_queue.put_nowait("Integration finished")
-        if s < 100:
-            progress_bar['value'] = 100
+    integral_matrix = calc_integrals_on_apertures_unit_circle(integration_limits, theta0, rho0, zernike_polynomials_list,
+                                                              abort_event=abort_event, aperture_radius=aperture_radius,
+                                                              n_steps=n_steps, swapXY=swapXY)
+    # The flag could be set during the integration, so check it again
+    if not abort_event.is_set():
+        print(f"Calculated {len(zernike_polynomials_list)} polynomials")
+        messages_queue.put_nowait("Integration finished"); progress_bar['value'] = 100
     else:
+        # Integration was aborted
+        progress_bar['value'] = 0; integral_matrix = []
         messages_queue.put_nowait("Integration aborted")
     return integral_matrix
 
@@ -498,27 +513,22 @@ def get_coms_shifts(coms_nonaberrated: np.ndarray, integral_matrix: np.ndarray,
 
     """
     min_dist_peaks = int(np.round(1.5*aperture_radius, 0))  # estimation based on specified aperture radius
+    # Differences between all aberrated (rows) and non-aberrated (columns) CoMs, calculated at once
+    diffY_sign = coms_aberrated[:, 0, np.newaxis] - coms_nonaberrated[np.newaxis, :, 0]
+    diffX_sign = coms_aberrated[:, 1, np.newaxis] - coms_nonaberrated[np.newaxis, :, 1]
+    matches = (np.abs(diffX_sign) < float((min_dist_peaks/2))) & (np.abs(diffY_sign) < float((min_dist_peaks/2)))
+    matched = np.any(matches, axis=1); i_matched = np.flatnonzero(matched)
+    j_matched = np.argmax(matches[i_matched], axis=1)  # the first matching CoM from non-aberrated image
     # Calculate the shifts between CoMs in aberrated and non-aberrated images
     coms_shifts = np.zeros((np.size(coms_aberrated, 0), 2), dtype='float')  # Shifts between CoMs
+    coms_shifts[i_matched, 0] = -diffY_sign[i_matched, j_matched]  # Direction of Y axis swapped (not as on the picture)
+    coms_shifts[i_matched, 1] = diffX_sign[i_matched, j_matched]  # Direction of X axis is the same as on the picture
     # Recalculate the integration values that will be used further for calculation of alpha coefficient
     integral_matrix_aberrated = np.zeros((np.size(coms_aberrated, 0), np.size(integral_matrix, 1)), dtype='float')
-    i_central_aperture = -1  # for defining the central aperture in the aberrated list of CoMs
-    # Below - calculation of shifts between CoMs
-    for i in range(np.size(coms_aberrated, 0)):
-        central_aperture_found = True  # flag for defining the index of central sub-aperture in the aberrated list
-        for j in range(0, np.size(coms_nonaberrated, 0)):
-            diffY = abs(coms_aberrated[i, 0] - coms_nonaberrated[j, 0]); diffX = abs(coms_aberrated[i, 1] - coms_nonaberrated[j, 1])
-            diffY_sign = (coms_aberrated[i, 0] - coms_nonaberrated[j, 0]); diffX_sign = (coms_aberrated[i, 1] - coms_nonaberrated[j, 1])
-            if (diffX < float((min_dist_peaks/2))) and (diffY < float((min_dist_peaks/2))):
-                central_aperture_found = False  # the matching is defined, shift found => it's not the central sub-aperture
-                coms_shifts[i, 0] = -diffY_sign  # Direction of Y axis swapped (not as on the picture, from top to bottom)
-                coms_shifts[i, 1] = diffX_sign  # Direction of X axis is the same as on the picture (from left to right)
-                for k in range(np.size(integral_matrix, 1)):
-                    integral_matrix_aberrated[i, k] = integral_matrix[j, k]
-                break  # Stop searching the candidates within CoMs from nonaberrated image if the actual shift found
-        if central_aperture_found:
-            # print("Central subaperture found:", i)
-            i_central_aperture = i  # record the found index for further removing of the central aperture integral values and coms
+    integral_matrix_aberrated[i_matched, :] = integral_matrix[j_matched, :]
+    # The not matched CoM - the central sub-aperture (the last one of them if several CoMs are not matched)
+    not_matched = np.flatnonzero(~matched)
+    i_central_aperture = not_matched[-1] if np.size(not_matched) > 0 else -1
     # Below: removing belonging to central subaperture values
     coms_shifts = np.delete(coms_shifts, i_central_aperture, axis=0)
     coms_aberrated = np.delete(coms_aberrated, i_central_aperture, axis=0)
@@ -528,7 +538,7 @@ def get_coms_shifts(coms_nonaberrated: np.ndarray, integral_matrix: np.ndarray,
 
 
 def get_coms_shifts_fast(coms_nonaberrated: np.ndarray, integral_matrix: np.ndarray,
-                         coms_aberrated: np.ndarray) -> tuple:
+                         coms_aberrated: np.ndarray, out: np.ndarray = None) -> tuple:
     """
     Calculate shifts between non- and aberrated CoMs. The last ones should be calculated previously by calling get_coms_fast().
 
@@ -540,6 +550,8 @@ def get_coms_shifts_fast(coms_nonaberrated: np.ndarray, integral_matrix: np.ndar
         Calculated center of masses around local focal spots on the aberrated image.
     integral_matrix : np.ndarray
         Calculated the integral matrix for Zernike polynomials.
+    out : np.ndarray, optional
+        Preallocated array with the shape (Number of spots, 2) for storing the shifts (reused for each frame). The default is None.
 
     Returns
     -------
@@ -547,37 +559,52 @@ def get_coms_shifts_fast(coms_nonaberrated: np.ndarray, integral_matrix: np.ndar
         (shifts of CoMs, integral matrix, aberrated CoMs).
 
     """
-    # Delete peaks with negative coordinates (less than absolute threshold, defined before)
     size = np.size(coms_aberrated, 0)
-    coms_shifts = np.zeros((np.size(coms_aberrated, 0), 2), dtype='float')  # Shifts between CoMs
-    for i in range(np.size(coms_aberrated, 0)):
-        if coms_aberrated[i, 0] == -1 and coms_aberrated[i, 1] == -1:
-            # for further deletion
-            coms_shifts[i, 0] = -1000; coms_shifts[i, 1] = -1000
-        else:
-            diffY_sign = (coms_aberrated[i, 0] - coms_nonaberrated[i, 0])
-            diffX_sign = (coms_aberrated[i, 1] - coms_nonaberrated[i, 1])
-            coms_shifts[i, 0] = -diffY_sign  # Direction of Y axis swapped (not as on the picture, from top to bottom)
-            coms_shifts[i, 1] = diffX_sign  # Direction of X axis is the same as on the picture (from left to right)
-    j = 0
-    # Delete non-detected spots
-    while j < size:
-        if coms_aberrated[j, 0] == -1 and coms_aberrated[j, 1] == -1:
-            coms_aberrated = np.delete(coms_aberrated, j, axis=0)
-            coms_shifts = np.delete(coms_shifts, j, axis=0)
-            integral_matrix = np.delete(integral_matrix, j, axis=0)
-            size = np.size(coms_aberrated, 0)
-        else:
-            j += 1
+    if out is not None and out.shape == (size, 2):
+        coms_shifts = out
+    else:
+        coms_shifts = np.zeros((size, 2), dtype='float')  # Shifts between CoMs
+    # Direction of Y axis swapped (not as on the picture, from top to bottom)
+    np.subtract(coms_nonaberrated[:size, 0], coms_aberrated[:, 0], out=coms_shifts[:, 0])
+    # Direction of X axis is the same as on the picture (from left to right)
+    np.subtract(coms_aberrated[:, 1], coms_nonaberrated[:size, 1], out=coms_shifts[:, 1])
+    # Delete non-detected spots (with coordinates -1, less than absolute threshold, defined before)
+    not_detected = np.flatnonzero((coms_aberrated[:, 0] == -1) & (coms_aberrated[:, 1] == -1))
+    if np.size(not_detected) > 0:
+        coms_aberrated = np.delete(coms_aberrated, not_detected, axis=0)
+        coms_shifts = np.delete(coms_shifts, not_detected, axis=0)
+        integral_matrix = np.delete(integral_matrix, not_detected, axis=0)
 
     return coms_shifts, integral_matrix, coms_aberrated
 
 
+def load_from_npz(npz_path: str, array_name: str) -> np.ndarray:
+    """
+    Load the named array from the *.npz archive.
+
+    Parameters
+    ----------
+    npz_path : str
+        Path to the *.npz archive.
+    array_name : str
+        Name of the array (keyword used for saving it in the archive).
+
+    Returns
+    -------
+    np.ndarray
+        Loaded array.
+
+    """
+    with np.load(npz_path) as npz_archive:
+        return npz_archive[array_name]
+
+
 # %% Threaded class for integral matrix calculation
 class IntegralMatrixThreaded(Thread):
     """Calculate integral matrix in the threaded manner."""
 
     messages_queue: Queue
+    abort_event: Event
     order: int
     theta0: np.ndarray
     rho0: np.ndarray
@@ -585,10 +612,10 @@ class IntegralMatrixThreaded(Thread):
     radius_subaperture: float
     integral_matrix: np.ndarray
 
-    def __init__(self, messages_queue: Queue, order: int, theta0: np.ndarray, rho0: np.ndarray,
+    def __init__(self, messages_queue: Queue, abort_event: Event, order: int, theta0: np.ndarray, rho0: np.ndarray,
                  integration_limits: np.ndarray, radius_subaperture: float, progress_bar,
                  integral_matrix: np.ndarray):
-        self.messages_queue = messages_queue; self.order = order; self.theta0 = theta0
+        self.messages_queue = messages_queue; self.abort_event = abort_event; self.order = order; self.theta0 = theta0
         self.rho0 = rho0; self.integration_limits = integration_limits; self.radius_subaperture = radius_subaperture
         self.progress_bar = progress_bar; self.integral_matrix = integral_matrix
         super().__init__()  # initialization of a new thread
@@ -605,7 +632,8 @@ class IntegralMatrixThreaded(Thread):
         print("Integral matrix calculation started")
         self.integral_matrix = calc_integral_matrix_zernike(self.progress_bar, get_zernike_coefficients_list(self.order),
                                                             self.integration_limits, self.theta0, self.rho0,
-                                                            self.messages_queue, self.radius_subaperture)
+                                                            self.messages_queue, self.abort_event,
+                                                            aperture_radius=self.radius_subaperture)
         print("Integral matrix calculation finished")
 
 
@@ -9,6 +9,8 @@ Calculation of Zernike polynomials, plot their surface maps on the unit aperture
 """
 # %% Imports - global dependencies (from standard library and installed by conda / pip)
 import numpy as np
+from math import factorial
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from matplotlib import cm
 plt.close('all')  # closing all opened and pending figures
@@ -122,8 +124,7 @@ def zernike_polynomials_sum_tuned(orders: list, alpha_coefficients: list, step_r
     """
     Calculate sum of Zernike's polynomials using specified amplitudes (alpha coefficients).
 
-    NOTE: this sum calculation using the tabular values up to 7th order and vectorization of triangular function calculation.
-    It's speed up, but not universal. Rewrite in the need of customizing to the arbitrary order calculation.
+    NOTE: the polynomials are calculated as radial and angular parts by get_zernike_basis() function.
 
     Parameters
     ----------
@@ -151,10 +152,8 @@ def zernike_polynomials_sum_tuned(orders: list, alpha_coefficients: list, step_r
     R = np.arange(0.0, 1.0+step_r, step_r)  # steps on r (polar coordinate)
     Theta = np.arange(0.0, (2.0*np.pi + np.radians(step_theta)), np.radians(step_theta))  # steps on theta (polar coordinates)
     (i_size, j_size) = (np.size(R, 0), np.size(Theta, 0))
-    # Calculation of sum of Zernike's polynomials (on all points sequentially => slow, deleted)
-    # Speed up the calculation by using vectorization of calculation on angles theta and using tabulated function values
-    Z = np.zeros((i_size, j_size), dtype='float')  # for storing Zernike's polynomial values
-    S = np.zeros((i_size, j_size), dtype='float')  # initial sum
+    # Select the polynomials with actually non-zero amplitudes
+    used_orders = []; used_amplitudes = []
     for k in range(len(orders)):
         if abs(alpha_coefficients[k]) > 1.0E-6:  # the alpha or amplitude coefficient is actually non-zero
             tuple_orders = orders[k]
@@ -162,17 +161,143 @@ def zernike_polynomials_sum_tuned(orders: list, alpha_coefficients: list, step_r
                     and len(tuple_orders != 2)):  # checking for conformity with specification of orders
                 raise TypeError
             else:
-                (m, n) = tuple_orders
-                norm = normalization_factor(m, n)
-                for i in range(i_size):
-                    Z[i, :] = (alpha_coefficients[k]*norm*tabular_radial_polynomial(m, n, R[i])
-                               * (vectorized_triangular_function(m, Theta)[:]))  # get the pol. value
-                S += Z  # adding to the final sum of all contributed Zernike's polynomials
-        else:
-            continue  # goes further on the loop for the next polynomial with non-zero amplitude
+                used_orders.append(tuple_orders); used_amplitudes.append(alpha_coefficients[k])
+    if len(used_orders) == 0:
+        return R, Theta, np.zeros((i_size, j_size), dtype='float')
+    R, Theta, radial_part, angular_part = get_zernike_basis(used_orders, step_r, step_theta)
+    # weighted by amplitudes sum of all contributed Zernike's polynomials
+    S = np.dot(radial_part*np.asarray(used_amplitudes), angular_part)
     return R, Theta, S    # tuple can be defined by coma separation
 
 
+def get_zernike_basis(orders: list, step_r: float = 0.01, step_theta: float = 1.0) -> tuple:
+    """
+    Calculate normalized radial and angular parts of Zernike's polynomials on the polar grid.
+
+    NOTE: the parts of each polynomial are cached for the used grid steps by get_radial_part() and get_angular_part().
+    The sum of polynomials with amplitudes alpha is then np.dot(radial_part*alpha, angular_part).
+
+    Parameters
+    ----------
+    orders : list
+        List of Zernike polynomials orders recorded in tuples (m, n) inside the list like [(m, n), ...].
+    step_r : float, optional
+        Step for calculation of radius for a summing map (colormap). The default is 0.01.
+    step_theta : float, optional
+        Step (in grades) for calculation of angle for a summing map (colormap). The default is 1.0.
+
+    Returns
+    -------
+    tuple
+        In the form (R, Theta, radial_part, angular_part) there R - radial coordinates vector, Theta - angular
+        coordinates vector, radial_part - 2D array (size of R, number of orders) with normalized radial polynomials,
+        angular_part - 2D array (number of orders, size of Theta) with triangular functions.
+
+    """
+    R = np.arange(0.0, 1.0+step_r, step_r)  # steps on r (polar coordinate)
+    Theta = np.arange(0.0, (2.0*np.pi + np.radians(step_theta)), np.radians(step_theta))  # steps on theta (polar coordinates)
+    (i_size, j_size) = (np.size(R, 0), np.size(Theta, 0))
+    radial_part = np.zeros((i_size, len(orders)), dtype='float')
+    angular_part = np.zeros((len(orders), j_size), dtype='float')
+    for k in range(len(orders)):
+        (m, n) = orders[k]
+        radial_part[:, k] = get_radial_part(m, n, step_r); angular_part[k, :] = get_angular_part(m, step_theta)
+    return R, Theta, radial_part, angular_part
+
+
+def get_cartesian_grid_indices(step_r: float = 0.01, step_theta: float = 1.0, size: int = 256) -> tuple:
+    """
+    Map pixels of the square image of the unit circle to the nearest points of the polar grid used by get_zernike_basis().
+
+    NOTE: the angle is counted clockwise as on the polar plots made by get_plot_zps_polar(), if the image is shown
+    with the origin in the upper left corner (default for matplotlib imshow()).
+
+    Parameters
+    ----------
+    step_r : float, optional
+        Step of radius of the polar grid. The default is 0.01.
+    step_theta : float, optional
+        Step (in grades) of angle of the polar grid. The default is 1.0.
+    size : int, optional
+        Width and height of the image in pixels. The default is 256.
+
+    Returns
+    -------
+    tuple
+        (indices, mask) there mask - 2D boolean array (size, size) with pixels inside the unit circle, indices - 1D array
+        with indices of the flattened polynomials sum S calculated on the polar grid for these pixels, so the image
+        can be filled as image[mask] = S.ravel()[indices].
+
+    """
+    n_r = np.size(np.arange(0.0, 1.0+step_r, step_r), 0)
+    n_theta = np.size(np.arange(0.0, (2.0*np.pi + np.radians(step_theta)), np.radians(step_theta)), 0)
+    coordinates = (np.arange(size) + 0.5)*(2.0/size) - 1.0  # pixel centers in the [-1, 1] range
+    X, Y = np.meshgrid(coordinates, coordinates)  # Y axis directed downwards as rows of the image
+    rho = np.sqrt(X*X + Y*Y); mask = rho <= 1.0
+    theta = np.mod(np.arctan2(Y[mask], X[mask]), 2.0*np.pi)
+    i_r = np.minimum(np.rint(rho[mask]/step_r).astype(int), n_r - 1)
+    j_theta = np.minimum(np.rint(theta/np.radians(step_theta)).astype(int), n_theta - 1)
+    return i_r*n_theta + j_theta, mask
+
+
+@lru_cache(maxsize=256)
+def get_radial_part(m: int, n: int, step_r: float = 0.01) -> np.ndarray:
+    """
+    Calculate normalized radial polynomial on the radial grid used by get_zernike_basis(), cached for each grid step.
+
+    NOTE: the radial polynomial R(m, n) = Q(r^2)*r^|m| there Q - reduced radial polynomial calculated by Horner's scheme.
+
+    Parameters
+    ----------
+    m : int
+        Angular order of Zernike's polynomial.
+    n : int
+        Radial order of Zernike's polynomial.
+    step_r : float, optional
+        Step for calculation of radius. The default is 0.01.
+
+    Returns
+    -------
+    np.ndarray
+        Not writeable (shared by calls) 1D array with normalized radial polynomial values.
+
+    """
+    R = np.arange(0.0, 1.0+step_r, step_r); R_squared = R*R
+    reduced_polynomial = np.zeros(np.size(R, 0), dtype='float')
+    for coefficient in get_reduced_radial_coefficients(m, n)[::-1]:
+        reduced_polynomial = reduced_polynomial*R_squared + coefficient
+    radial_part = normalization_factor(m, n)*np.power(R, abs(m))*reduced_polynomial
+    radial_part.setflags(write=False)
+    return radial_part
+
+
+@lru_cache(maxsize=256)
+def get_angular_part(m: int, step_theta: float = 1.0) -> np.ndarray:
+    """
+    Calculate triangular function on the angular grid used by get_zernike_basis(), cached for each grid step.
+
+    Parameters
+    ----------
+    m : int
+        Angular order of Zernike's polynomial.
+    step_theta : float, optional
+        Step (in grades) for calculation of angle. The default is 1.0.
+
+    Returns
+    -------
+    np.ndarray
+        Not writeable (shared by calls) 1D array with triangular function values.
+
+    """
+    Theta = np.arange(0.0, (2.0*np.pi + np.radians(step_theta)), np.radians(step_theta))
+    if m >= 0:
+        angular_part = np.cos(m*Theta)
+    else:
+        angular_part = np.sin(m*Theta)
+    angular_part.setflags(write=False)
+    return angular_part
+
+
 def plot_zps_polar(orders: list, step_r: float = 0.005, step_theta: float = 0.5, title: str = "Sum of Zernike polynomials",
                    alpha_coefficients: list = [], show_amplitudes: bool = False):
     """
@@ -214,7 +339,7 @@ def plot_zps_polar(orders: list, step_r: float = 0.005, step_theta: float = 0.5,
 
 def get_plot_zps_polar(figure, orders: list, alpha_coefficients: list, step_r: float = 0.01,
                        step_theta: float = 1.0, show_amplitudes: bool = False,
-                       clear_axes: bool = True):
+                       clear_axes: bool = True, zps_grid: tuple = None):
     """
     Plot Zernike's polynomials sum ("zps") in polar projection for the unit radius circle on the input matplotlib. figure instance.
 
@@ -234,6 +359,9 @@ def get_plot_zps_polar(figure, orders: list, alpha_coefficients: list, step_r: f
         Show the colour-bar on the plot with amplitudes. The default is False.
     clear_axes : bool, optional
         Clear the axes on the figure. The default is True.
+    zps_grid : tuple, optional
+        Precalculated by zernike_polynomials_sum_tuned() tuple (R, Theta, S), plotted instead of calculation of the sum
+        for the same orders and coefficients (e.g., for only switching the colour-bar). The default is None.
 
     Raises
     ------
@@ -243,10 +371,13 @@ def get_plot_zps_polar(figure, orders: list, alpha_coefficients: list, step_r: f
     Returns
     -------
     figure : matplotlib.figure.Figure()
-        The Figure() instance with plotted colormesh graph.
+        The same (input) Figure() instance with plotted colormesh graph.
 
     """
-    R, Theta, S = zernike_polynomials_sum_tuned(orders, alpha_coefficients, step_r=step_r, step_theta=step_theta)
+    if zps_grid is None:
+        R, Theta, S = zernike_polynomials_sum_tuned(orders, alpha_coefficients, step_r=step_r, step_theta=step_theta)
+    else:
+        R, Theta, S = zps_grid
     # Below - clearing of picture axes, for preventing adding many axes to the single figure
     if clear_axes:
         figure.clear()  # additional flag for the clearing of figure
@@ -263,6 +394,33 @@ def get_plot_zps_polar(figure, orders: list, alpha_coefficients: list, step_r: f
     return figure
 
 
+def get_reduced_radial_coefficients(m: int, n: int) -> list:
+    """
+    Calculate coefficients of the reduced radial polynomial Q(r^2), there radial polynomial R(m, n) = (r^|m|)*Q(r^2).
+
+    Parameters
+    ----------
+    m : int
+        Angular order of Zernike's polynomial.
+    n : int
+        Radial order of Zernike's polynomial.
+
+    Returns
+    -------
+    list
+        Coefficients in the ascending order of powers of r^2. Empty list for not valid orders (radial polynomial = 0).
+
+    """
+    m = abs(m)
+    if m > n or (n - m) % 2 != 0:
+        return []
+    n_coefficients = (n - m)//2 + 1; coefficients = [0]*n_coefficients
+    for k in range(n_coefficients):
+        coefficients[n_coefficients - 1 - k] = ((-1)**k)*factorial(n-k)//(factorial(k)*factorial((n+m)//2 - k)
+                                                                           * factorial((n-m)//2 - k))
+    return coefficients
+
+
 def vectorized_triangular_function(m: int, Theta: np.ndarray) -> np.ndarray:
     """
     Calculate triangular Zernike's function on the input array of angles theta (vectorization).
@@ -467,6 +625,40 @@ def triangular_derivative_dtheta(m: int, theta: float) -> float:
         return 0.0
 
 
+def vectorized_radial_polynomial_derivative(m: int, n: int, r: np.ndarray) -> tuple:
+    """
+    Calculate radial polynomial and its derivative on radius on the input array of radii (vectorization).
+
+    NOTE: R(m, n) = Q(r^2)*r^|m| => dR/dr = |m|*Q(r^2)*r^(|m|-1) + 2*Q'(r^2)*r^(|m|+1), Q and Q' calculated by Horner's scheme.
+
+    Parameters
+    ----------
+    m : int
+        Angular order of Zernike's polynomial.
+    n : int
+        Radial order of Zernike's polynomial.
+    r : np.ndarray
+        Polar radial coordinates r (rho).
+
+    Returns
+    -------
+    tuple
+        As (R, dR/dr) - arrays with the same shape as the input radii array.
+
+    """
+    r = np.asarray(r, dtype='float'); r_squared = r*r; m = abs(m)
+    reduced_polynomial = np.zeros(r.shape, dtype='float'); reduced_derivative = np.zeros(r.shape, dtype='float')
+    for coefficient in get_reduced_radial_coefficients(m, n)[::-1]:
+        reduced_derivative = reduced_derivative*r_squared + reduced_polynomial  # Horner's scheme for Q'(r^2) on the fly
+        reduced_polynomial = reduced_polynomial*r_squared + coefficient
+    if m == 0:
+        return reduced_polynomial, 2.0*r*reduced_derivative
+    r_power = np.power(r, m-1)  # r^(|m|-1), shared by the polynomial and its derivative
+    radial_polynomial_values = r_power*r*reduced_polynomial
+    radial_derivative_values = r_power*(m*reduced_polynomial + 2.0*r_squared*reduced_derivative)
+    return radial_polynomial_values, radial_derivative_values
+
+
 def get_classical_polynomial_name(mode: tuple, short_names: bool = False) -> str:
     """
     Return the classical name of Zernike polynomial.